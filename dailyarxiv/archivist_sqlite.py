@@ -1,17 +1,135 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Sized
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Any, Iterable, Iterator
+from typing import Any, Callable, Iterable, Iterator, Mapping, TypeVar
 
+from pydantic import ValidationError
 from zoneinfo import ZoneInfo
 
 from .models import DailyReport, PaperAnalysis, PaperCandidate, PeriodTrend, RelevanceJudgement
 
+try:
+    # Optional: orjson is considerably faster than the stdlib encoder.
+    import orjson
+
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode("utf-8")
+
+    _loads = orjson.loads
+
+except ImportError:
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False)
+
+    _loads = json.loads
+
+
+_LEGACY_SUMMARY_CN = "（旧数据缺少摘要翻译）"
+
+# Fast zlib level: payloads are repetitive JSON, so even low levels shrink them several-fold.
+_ZLIB_LEVEL = 3
+
+
+def _decode_payload(value: str | bytes) -> str | bytes:
+    """Compressed payloads are stored as BLOBs; plain JSON rows stay TEXT. Both are readable."""
+    if isinstance(value, bytes):
+        return zlib.decompress(value)
+    return value
+
+
+def abstract_sha1(abstract: str) -> str:
+    """Fingerprint of a paper's abstract: a revised arXiv version gets a new hash and is re-analyzed."""
+    return hashlib.sha1(abstract.encode("utf-8")).hexdigest()
+
+
+def reuse_key(keywords: Iterable[str], *, model: str, prompt_version: str) -> str:
+    """
+    Key an archived judgement/analysis is reused under: the model and prompt version that produced
+    it, plus the keywords trimmed, case-folded, de-duplicated and sorted (order, case and the JSON
+    encoder in use do not matter).
+    """
+    kws = sorted({k.strip().casefold() for k in keywords if k.strip()})
+    return hashlib.sha1(json.dumps([prompt_version, model, kws], ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+_T = TypeVar("_T")
+
+
+def _rows(items: Iterable[_T], make_row: Callable[[_T], tuple[Any, ...]]) -> Iterable[tuple[Any, ...]]:
+    """
+    Rows for _insert_rows(). Sized inputs become one list (list(map(...)) pre-sizes from len());
+    anything else streams lazily so unbounded iterables never materialize.
+    """
+    if isinstance(items, Sized):
+        return list(map(make_row, items))
+    return map(make_row, items)
+
+
+# Bound parameters per statement; 999 is SQLITE_MAX_VARIABLE_NUMBER on SQLite builds before 3.32.
+_MAX_SQL_PARAMS = 999
+
+
+@functools.lru_cache(maxsize=64)
+def _multirow_insert_sql(table: str, columns: tuple[str, ...], n_rows: int) -> str:
+    group = "(" + ", ".join("?" * len(columns)) + ")"
+    return f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES " + ", ".join([group] * n_rows)
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_payloads_sql(table: str, n_pairs: int) -> str:
+    return f"""
+        WITH wanted(paper_id, abstract_sha1) AS (VALUES {", ".join(["(?, ?)"] * n_pairs)})
+        SELECT t.paper_id, t.payload_json
+        FROM wanted w
+        JOIN {table} t ON t.paper_id = w.paper_id AND t.abstract_sha1 = w.abstract_sha1
+        JOIN runs u ON u.run_id = t.run_id
+        WHERE t.reuse_key = ?
+        ORDER BY u.generated_at DESC
+    """
+
+
+def _insert_rows(
+    con: sqlite3.Connection, table: str, columns: tuple[str, ...], rows: Iterable[tuple[Any, ...]]
+) -> None:
+    """
+    INSERT OR REPLACE as multi-row VALUES statements of up to _MAX_SQL_PARAMS parameters each:
+    one statement step per chunk instead of one per row as with executemany(). Full chunks reuse
+    the same SQL text, so sqlite3's statement cache only prepares it once.
+    """
+    per_statement = max(1, _MAX_SQL_PARAMS // len(columns))
+    it = iter(rows)
+    while chunk := list(islice(it, per_statement)):
+        con.execute(_multirow_insert_sql(table, columns, len(chunk)), [v for row in chunk for v in row])
+
+
+def _apply_pragmas(con: sqlite3.Connection, *, durable: bool = False) -> None:
+    """
+    Connection-level tuning, applied once per connection. Issued via execute() rather than
+    executescript() so no implicit COMMIT is forced. The busy timeout comes from
+    sqlite3.connect(timeout=...), so it is not repeated here.
+    """
+    con.execute("PRAGMA journal_mode=WAL")
+    # WAL + NORMAL stays crash-consistent; only the last commits may be lost on power failure.
+    # durable=True syncs the WAL on every commit instead.
+    con.execute("PRAGMA synchronous=FULL" if durable else "PRAGMA synchronous=NORMAL")
+    con.execute("PRAGMA temp_store=MEMORY")
+    con.execute("PRAGMA mmap_size=268435456")
+    con.execute("PRAGMA cache_size=-65536")
+    con.execute("PRAGMA wal_autocheckpoint=1000")
+
 
 @dataclass(frozen=True)
 class RunInfo:
@@ -20,80 +138,188 @@ class RunInfo:
 
 
 class ArchivistSQLite:
-    def __init__(self, path: Path) -> None:
+    def __init__(self, path: Path | str, *, compress_payloads: bool = False, durable: bool = False) -> None:
+        # `path` may also be ":memory:" (e.g. tests): nothing touches the disk.
         self.path = path
+        self._compress_payloads = compress_payloads
+        # One long-lived connection: keeps sqlite3's prepared-statement cache warm across writes.
+        # isolation_level=None leaves transaction control to _connect().
+        self._con = sqlite3.connect(
+            self.path,
+            timeout=30,
+            check_same_thread=False,
+            isolation_level=None,
+            cached_statements=256,
+        )
+        self._con.row_factory = sqlite3.Row
+        # Make sure no statement-trace hook is installed on this connection.
+        self._con.set_trace_callback(None)
+        # The connection is shared across threads (e.g. GUI worker); serialize access to it.
+        self._lock = threading.RLock()
+        _apply_pragmas(self._con, durable=durable)
         self._init_db()
 
+    def _encode_payload(self, text: str) -> str | bytes:
+        if self._compress_payloads:
+            return zlib.compress(text.encode("utf-8"), _ZLIB_LEVEL)
+        return text
+
+    def close(self) -> None:
+        with self._lock:
+            self._con.close()
+
+    def __enter__(self) -> "ArchivistSQLite":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
     @contextmanager
     def _connect(self) -> Iterator[sqlite3.Connection]:
-        con = sqlite3.connect(self.path, timeout=30)
-        con.row_factory = sqlite3.Row
-        try:
-            yield con
-        except Exception:
+        with self._lock:
+            con = self._con
+            if con.in_transaction:
+                # Inside begin_run_transaction(): statements join the open transaction.
+                yield con
+                return
+            con.execute("BEGIN")
             try:
+                yield con
+            except Exception:
                 con.rollback()
-            finally:
-                con.close()
-            raise
-        else:
-            try:
+                raise
+            else:
                 con.commit()
-            finally:
-                con.close()
 
     def _init_db(self) -> None:
-        with self._connect() as con:
-            con.executescript(
-                """
-                PRAGMA journal_mode=WAL;
-
-                CREATE TABLE IF NOT EXISTS runs (
-                  run_id TEXT PRIMARY KEY,
-                  report_date TEXT NOT NULL,
-                  generated_at TEXT NOT NULL,
-                  source_range_start TEXT NOT NULL,
-                  source_range_end TEXT NOT NULL,
-                  categories_json TEXT NOT NULL,
-                  keywords_json TEXT NOT NULL,
-                  counts_json TEXT NOT NULL
-                );
-
-                CREATE TABLE IF NOT EXISTS candidates (
-                  run_id TEXT NOT NULL,
-                  paper_id TEXT NOT NULL,
-                  payload_json TEXT NOT NULL,
-                  PRIMARY KEY (run_id, paper_id)
-                );
-
-                CREATE TABLE IF NOT EXISTS judgements (
-                  run_id TEXT NOT NULL,
-                  paper_id TEXT NOT NULL,
-                  payload_json TEXT NOT NULL,
-                  PRIMARY KEY (run_id, paper_id)
-                );
-
-                CREATE TABLE IF NOT EXISTS analyses (
-                  run_id TEXT NOT NULL,
-                  paper_id TEXT NOT NULL,
-                  payload_json TEXT NOT NULL,
-                  publish_date TEXT NOT NULL,
-                  PRIMARY KEY (run_id, paper_id)
-                );
-
-                CREATE TABLE IF NOT EXISTS trends (
-                  run_id TEXT NOT NULL,
-                  period TEXT NOT NULL,
-                  payload_json TEXT NOT NULL,
-                  PRIMARY KEY (run_id, period)
-                );
-
-                CREATE TABLE IF NOT EXISTS reports (
-                  run_id TEXT PRIMARY KEY,
-                  payload_json TEXT NOT NULL
-                );
-                """
-            )
+        self._con.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS runs (
+              run_id TEXT PRIMARY KEY,
+              report_date TEXT NOT NULL,
+              generated_at TEXT NOT NULL,
+              source_range_start TEXT NOT NULL,
+              source_range_end TEXT NOT NULL,
+              categories_json TEXT NOT NULL,
+              keywords_json TEXT NOT NULL,
+              counts_json TEXT NOT NULL
+            );
+            -- Serves the per-day MAX(generated_at) lookups in stats/export_report/get_analyses_between.
+            -- analyses(run_id) needs no extra index: it is the leading column of the primary key.
+            CREATE INDEX IF NOT EXISTS idx_runs_date_gen ON runs(report_date, generated_at DESC);
+
+            CREATE TABLE IF NOT EXISTS candidates (
+              run_id TEXT NOT NULL,
+              paper_id TEXT NOT NULL,
+              payload_json TEXT NOT NULL,
+              PRIMARY KEY (run_id, paper_id)
+            );
+
+            CREATE TABLE IF NOT EXISTS judgements (
+              run_id TEXT NOT NULL,
+              paper_id TEXT NOT NULL,
+              payload_json TEXT NOT NULL,
+              abstract_sha1 TEXT,
+              PRIMARY KEY (run_id, paper_id)
+            );
+
+            CREATE TABLE IF NOT EXISTS analyses (
+              run_id TEXT NOT NULL,
+              paper_id TEXT NOT NULL,
+              payload_json TEXT NOT NULL,
+              publish_date TEXT NOT NULL,
+              abstract_sha1 TEXT,
+              PRIMARY KEY (run_id, paper_id)
+            );
+
+            CREATE TABLE IF NOT EXISTS trends (
+              run_id TEXT NOT NULL,
+              period TEXT NOT NULL,
+              payload_json TEXT NOT NULL,
+              PRIMARY KEY (run_id, period)
+            );
+
+            CREATE TABLE IF NOT EXISTS reports (
+              run_id TEXT PRIMARY KEY,
+              payload_json TEXT NOT NULL
+            );
+
+            -- Raw LLM responses keyed by a hash of (provider, model, temperature, system, prompt).
+            CREATE TABLE IF NOT EXISTS llm_cache (
+              key BLOB PRIMARY KEY,
+              payload TEXT NOT NULL,
+              created_at REAL NOT NULL
+            );
+
+            -- Weekly/monthly trend summaries keyed by a hash of the paper ids they were written from.
+            CREATE TABLE IF NOT EXISTS trend_summaries (
+              period TEXT NOT NULL,
+              content_hash TEXT NOT NULL,
+              summary_cn TEXT NOT NULL,
+              created_at REAL NOT NULL,
+              PRIMARY KEY (period, content_hash)
+            );
+            """
+        )
+        # Databases created before abstract_sha1/reuse_key existed: add the columns (old rows stay NULL
+        # and never match).
+        for table in ("judgements", "analyses"):
+            cols = {r["name"] for r in self._con.execute(f"PRAGMA table_info({table})")}
+            for col in ("abstract_sha1", "reuse_key"):
+                if col not in cols:
+                    self._con.execute(f"ALTER TABLE {table} ADD COLUMN {col} TEXT")
+        self._con.executescript(
+            """
+            -- Serve the (paper_id, abstract_sha1) lookups in get_cached_judgements/get_cached_analyses.
+            CREATE INDEX IF NOT EXISTS idx_judgements_paper ON judgements(paper_id, abstract_sha1);
+            CREATE INDEX IF NOT EXISTS idx_analyses_paper ON analyses(paper_id, abstract_sha1);
+            """
+        )
+
+    def begin_run_transaction(self) -> None:
+        """
+        Open one write transaction that subsequent write_* calls join, so a run's rows
+        are committed with a single sync. Close it with end_run_transaction().
+        """
+        with self._lock:
+            if not self._con.in_transaction:
+                self._con.execute("BEGIN IMMEDIATE")
+
+    def end_run_transaction(self, *, commit: bool = True) -> None:
+        with self._lock:
+            if not self._con.in_transaction:
+                return
+            if commit:
+                self._con.commit()
+                # Refresh planner statistics for the new rows (cheap; ANALYZEs only when useful).
+                self._con.execute("PRAGMA optimize")
+            else:
+                self._con.rollback()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        `with arch.transaction(): ...` wraps begin/end_run_transaction(): the writes inside the block
+        commit together, or roll back if it raises. Inside an already-open transaction it just joins.
+
+        The lock is held for the whole block, because every thread shares this one connection and
+        would otherwise slip its statements into the open transaction. Other threads using this
+        instance wait until the block ends, so keep it to the writes themselves (other
+        ArchivistSQLite instances, like the GUI's, have their own connection and are not blocked).
+        """
+        with self._lock:
+            if self._con.in_transaction:
+                yield
+                return
+            self.begin_run_transaction()
+            try:
+                yield
+            except BaseException:
+                # KeyboardInterrupt / GeneratorExit too: a transaction left open here would swallow
+                # every later statement on the shared connection.
+                self.end_run_transaction(commit=False)
+                raise
+            self.end_run_transaction()
 
     def begin_run(
         self,
@@ -120,54 +346,121 @@ class ArchivistSQLite:
                     generated_at,
                     source_range_start,
                     source_range_end,
-                    json.dumps(categories, ensure_ascii=False),
-                    json.dumps(keywords, ensure_ascii=False),
-                    json.dumps(counts, ensure_ascii=False),
+                    _dumps(categories),
+                    _dumps(keywords),
+                    _dumps(counts),
                 ),
             )
         return run_id
 
     def write_candidates(self, run_id: str, candidates: Iterable[PaperCandidate]) -> None:
-        rows = [(run_id, c.id, json.dumps(c.model_dump(), ensure_ascii=False)) for c in candidates]
+        rows = _rows(candidates, lambda c: (run_id, c.id, self._encode_payload(c.model_dump_json())))
         with self._connect() as con:
-            con.executemany(
-                "INSERT OR REPLACE INTO candidates (run_id, paper_id, payload_json) VALUES (?, ?, ?)",
-                rows,
-            )
+            _insert_rows(con, "candidates", ("run_id", "paper_id", "payload_json"), rows)
 
-    def write_judgements(self, run_id: str, judgements_by_id: dict[str, RelevanceJudgement]) -> None:
-        rows: list[tuple[str, str, str]] = []
-        for pid, j in judgements_by_id.items():
-            rows.append((run_id, str(pid), json.dumps(j.model_dump(), ensure_ascii=False)))
+    def write_judgements(
+        self,
+        run_id: str,
+        judgements_by_id: dict[str, RelevanceJudgement],
+        *,
+        abstract_sha1_by_id: Mapping[str, str] | None = None,
+        reuse_key: str | None = None,
+    ) -> None:
+        shas = abstract_sha1_by_id or {}
+        rows = _rows(
+            judgements_by_id.items(),
+            lambda kv: (
+                run_id,
+                str(kv[0]),
+                self._encode_payload(kv[1].model_dump_json()),
+                shas.get(str(kv[0])),
+                reuse_key,
+            ),
+        )
         with self._connect() as con:
-            con.executemany(
-                "INSERT OR REPLACE INTO judgements (run_id, paper_id, payload_json) VALUES (?, ?, ?)",
-                rows,
+            _insert_rows(
+                con, "judgements", ("run_id", "paper_id", "payload_json", "abstract_sha1", "reuse_key"), rows
             )
 
-    def write_analyses(self, run_id: str, analyses: Iterable[PaperAnalysis]) -> None:
-        rows = [
-            (run_id, a.id, json.dumps(a.model_dump(), ensure_ascii=False), a.publish_date)
-            for a in analyses
-        ]
+    def write_analyses(
+        self,
+        run_id: str,
+        analyses: Iterable[PaperAnalysis],
+        *,
+        abstract_sha1_by_id: Mapping[str, str] | None = None,
+        reuse_key: str | None = None,
+    ) -> None:
+        shas = abstract_sha1_by_id or {}
+        rows = _rows(
+            analyses,
+            lambda a: (
+                run_id,
+                a.id,
+                self._encode_payload(a.model_dump_json()),
+                a.publish_date,
+                shas.get(a.id),
+                reuse_key,
+            ),
+        )
         with self._connect() as con:
-            con.executemany(
-                "INSERT OR REPLACE INTO analyses (run_id, paper_id, payload_json, publish_date) VALUES (?, ?, ?, ?)",
+            _insert_rows(
+                con,
+                "analyses",
+                ("run_id", "paper_id", "payload_json", "publish_date", "abstract_sha1", "reuse_key"),
                 rows,
             )
 
+    def get_cached_judgements(
+        self, abstract_sha1_by_id: Mapping[str, str], *, reuse_key: str
+    ) -> dict[str, RelevanceJudgement]:
+        """
+        Latest archived judgement per paper whose abstract hash matches and that was written under the
+        same reuse_key() (a judgement is only meaningful for the keywords, model and prompt it came from).
+        """
+        raw = self._cached_payloads("judgements", abstract_sha1_by_id, reuse_key)
+        return {pid: RelevanceJudgement.model_validate_json(p) for pid, p in raw.items()}
+
+    def get_cached_analyses(
+        self, abstract_sha1_by_id: Mapping[str, str], *, reuse_key: str
+    ) -> dict[str, PaperAnalysis]:
+        """Like get_cached_judgements(), for analyses (their content also depends on the keywords)."""
+        out: dict[str, PaperAnalysis] = {}
+        for pid, p in self._cached_payloads("analyses", abstract_sha1_by_id, reuse_key).items():
+            try:
+                out[pid] = PaperAnalysis.model_validate_json(p)
+            except ValidationError:
+                # Legacy/partial rows are simply re-analyzed.
+                continue
+        return out
+
+    def _cached_payloads(
+        self, table: str, abstract_sha1_by_id: Mapping[str, str], reuse_key: str
+    ) -> dict[str, str | bytes]:
+        # One statement per chunk of (paper_id, abstract_sha1) pairs; newest run first, so the
+        # first row seen per paper is the one to keep.
+        per_statement = (_MAX_SQL_PARAMS - 1) // 2
+        latest: dict[str, str | bytes] = {}
+        it = iter(abstract_sha1_by_id.items())
+        with self._connect() as con:
+            while chunk := list(islice(it, per_statement)):
+                params: list[Any] = [v for pair in chunk for v in pair]
+                params.append(reuse_key)
+                for row in con.execute(_cached_payloads_sql(table, len(chunk)), params):
+                    latest.setdefault(row["paper_id"], row["payload_json"])
+        return {pid: _decode_payload(payload) for pid, payload in latest.items()}
+
     def write_trend(self, run_id: str, trend: PeriodTrend) -> None:
         with self._connect() as con:
             con.execute(
                 "INSERT OR REPLACE INTO trends (run_id, period, payload_json) VALUES (?, ?, ?)",
-                (run_id, trend.period, json.dumps(trend.model_dump(), ensure_ascii=False)),
+                (run_id, trend.period, self._encode_payload(trend.model_dump_json())),
             )
 
     def write_daily_report(self, run_id: str, report: DailyReport) -> None:
         with self._connect() as con:
             con.execute(
                 "INSERT OR REPLACE INTO reports (run_id, payload_json) VALUES (?, ?)",
-                (run_id, json.dumps(report.model_dump(), ensure_ascii=False)),
+                (run_id, self._encode_payload(report.model_dump_json())),
             )
 
     def get_analyses_between(self, *, days: int, timezone: str = "UTC") -> list[PaperAnalysis]:
@@ -182,37 +475,35 @@ class ArchivistSQLite:
         end_iso = end.isoformat()
 
         with self._connect() as con:
-            run_rows = con.execute(
+            arows = con.execute(
                 """
-                SELECT report_date, MAX(generated_at) AS gen
-                FROM runs
-                WHERE report_date BETWEEN ? AND ?
-                GROUP BY report_date
+                SELECT a.payload_json
+                FROM analyses a
+                JOIN (
+                  SELECT report_date, MAX(generated_at) AS gen
+                  FROM runs
+                  WHERE report_date BETWEEN ? AND ?
+                  GROUP BY report_date
+                ) t ON a.run_id = t.report_date || '-' || t.gen
                 """,
                 (start_iso, end_iso),
             ).fetchall()
 
-            run_ids: list[str] = []
-            for rr in run_rows:
-                rd = rr["report_date"]
-                gen = rr["gen"]
-                run_ids.append(f"{rd}-{gen}")
-
-            if not run_ids:
-                return []
-
-            qmarks = ",".join("?" for _ in run_ids)
-            arows = con.execute(
-                f"SELECT payload_json FROM analyses WHERE run_id IN ({qmarks})",
-                run_ids,
-            ).fetchall()
-
         out: list[PaperAnalysis] = []
         for r in arows:
-            payload = json.loads(r["payload_json"])
-            if not str(payload.get("summary_cn", "")).strip():
-                payload["summary_cn"] = "（旧数据缺少摘要翻译）"
-            out.append(PaperAnalysis.model_validate(payload))
+            try:
+                # Fast path: pydantic-core parses and validates the JSON in one pass.
+                raw = _decode_payload(r["payload_json"])
+                a = PaperAnalysis.model_validate_json(raw)
+            except ValidationError:
+                # Legacy rows may lack summary_cn; patch the dict and validate again.
+                payload = _loads(raw)
+                if not str(payload.get("summary_cn", "")).strip():
+                    payload["summary_cn"] = _LEGACY_SUMMARY_CN
+                a = PaperAnalysis.model_validate(payload)
+            if not a.summary_cn.strip():
+                a.summary_cn = _LEGACY_SUMMARY_CN
+            out.append(a)
         return out
 
     def stats(self, *, days: int = 30) -> dict[str, Any]:
@@ -228,7 +519,7 @@ class ArchivistSQLite:
             ).fetchall()
         out = []
         for r in rows:
-            out.append({"report_date": r["report_date"], "counts": json.loads(r["counts_json"])})
+            out.append({"report_date": r["report_date"], "counts": _loads(r["counts_json"])})
         return {"recent_runs": out}
 
     def export_report(self, *, date: str) -> dict[str, Any]:
@@ -246,4 +537,35 @@ class ArchivistSQLite:
             ).fetchone()
         if not row:
             raise FileNotFoundError(f"No report for date={date}")
-        return json.loads(row["payload_json"])
+        return _loads(_decode_payload(row["payload_json"]))
+
+    def get_llm_response(self, key: bytes, *, max_age_secs: float) -> str | None:
+        with self._connect() as con:
+            row = con.execute("SELECT payload, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        if row is None or time.time() - float(row["created_at"]) > max_age_secs:
+            return None
+        payload = _decode_payload(row["payload"])
+        # Compressed rows decode to bytes; callers parse the reply text as str.
+        return payload.decode("utf-8") if isinstance(payload, bytes) else payload
+
+    def put_llm_response(self, key: bytes, text: str) -> None:
+        with self._connect() as con:
+            con.execute(
+                "INSERT OR REPLACE INTO llm_cache(key, payload, created_at) VALUES (?, ?, ?)",
+                (key, self._encode_payload(text), time.time()),
+            )
+
+    def get_trend_summary(self, period: str, content_hash: str) -> str | None:
+        with self._connect() as con:
+            row = con.execute(
+                "SELECT summary_cn FROM trend_summaries WHERE period = ? AND content_hash = ?",
+                (period, content_hash),
+            ).fetchone()
+        return None if row is None else row["summary_cn"]
+
+    def put_trend_summary(self, period: str, content_hash: str, summary_cn: str) -> None:
+        with self._connect() as con:
+            con.execute(
+                "INSERT OR REPLACE INTO trend_summaries(period, content_hash, summary_cn, created_at) VALUES (?, ?, ?, ?)",
+                (period, content_hash, summary_cn, time.time()),
+            )
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import functools
+import operator
+import re
 from collections import defaultdict
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Iterable
+from datetime import date, datetime, timedelta
+from typing import Any, Iterable
 
 from zoneinfo import ZoneInfo
 
@@ -18,14 +21,15 @@ class HarvestResult:
     candidates: list[PaperCandidate]
 
 
-def _to_date_str(dt: datetime, tz: ZoneInfo) -> str:
-    return dt.astimezone(tz).date().isoformat()
+_UTC = ZoneInfo("UTC")
 
 
-def _iso(dt: datetime) -> str:
-    if dt.tzinfo is None:
-        return dt.replace(tzinfo=ZoneInfo("UTC")).isoformat()
-    return dt.isoformat()
+def _updated_at(r: object) -> datetime | None:
+    """Result's updated (else published) timestamp; naive values are taken as UTC."""
+    updated = getattr(r, "updated", None) or getattr(r, "published", None)
+    if updated is not None and updated.tzinfo is None:
+        updated = updated.replace(tzinfo=_UTC)
+    return updated
 
 
 def _extract_affiliations(result: object) -> list[str]:
@@ -104,28 +108,30 @@ def harvest_candidates(
         sort_order=arxiv.SortOrder.Descending,
     )
     client = arxiv.Client()
-    results = list(client.results(search))
-    if not results:
-        now = datetime.now(tz)
-        return HarvestResult(
-            report_date=now.date().isoformat(),
-            source_range_start=now.isoformat(),
-            source_range_end=now.isoformat(),
-            candidates=[],
-        )
+    # Results arrive newest-first (LastUpdatedDate DESC), paged lazily by the client:
+    # iterate the generator and stop as soon as the remaining results cannot be kept.
+    results = client.results(search)
 
     now = datetime.now(tz)
     if mode == "fixed_window":
         start = now - timedelta(hours=time_window_hours)
         kept: list[PaperCandidate] = []
+        seen_any = False
         for r in results:
-            updated = getattr(r, "updated", None) or getattr(r, "published", None)
+            seen_any = True
+            updated = _updated_at(r)
             if updated is None:
                 continue
-            if updated.tzinfo is None:
-                updated = updated.replace(tzinfo=ZoneInfo("UTC"))
-            if updated >= start.astimezone(updated.tzinfo):
-                kept.append(_to_candidate(r))
+            if updated < start:
+                break
+            kept.append(_to_candidate(r, updated))
+        if not seen_any:
+            return HarvestResult(
+                report_date=now.date().isoformat(),
+                source_range_start=now.isoformat(),
+                source_range_end=now.isoformat(),
+                candidates=[],
+            )
         return HarvestResult(
             report_date=now.date().isoformat(),
             source_range_start=start.isoformat(),
@@ -135,17 +141,23 @@ def harvest_candidates(
 
     # latest_update_day (or explicit date_override)
     buckets: dict[str, list[PaperCandidate]] = defaultdict(list)
-    newest_dt: datetime | None = None
-    oldest_dt: datetime | None = None
+    newest_date: date | None = None
     for r in results:
-        updated = getattr(r, "updated", None) or getattr(r, "published", None)
+        updated = _updated_at(r)
         if updated is None:
             continue
-        if updated.tzinfo is None:
-            updated = updated.replace(tzinfo=ZoneInfo("UTC"))
-        newest_dt = updated if newest_dt is None else max(newest_dt, updated)
-        oldest_dt = updated if oldest_dt is None else min(oldest_dt, updated)
-        buckets[_to_date_str(updated, tz)].append(_to_candidate(r))
+        local_day = updated.astimezone(tz).date()
+        day = local_day.isoformat()
+        if date_override:
+            # Everything from here on is older than the requested day.
+            if buckets and day < date_override:
+                break
+        else:
+            if newest_date is None:
+                newest_date = local_day
+            elif (newest_date - local_day).days > lookback_days:
+                break
+        buckets[day].append(_to_candidate(r, updated))
 
     if not buckets:
         return HarvestResult(
@@ -194,23 +206,41 @@ def harvest_candidates(
     )
 
 
-def _to_candidate(r: object) -> PaperCandidate:
-    # arxiv.Result has: entry_id, title, authors, summary, updated, published, categories, primary_category
-    entry_id = getattr(r, "entry_id", "")
+# arxiv.Result has: entry_id, title, authors, summary, updated, published, categories, primary_category
+_RESULT_FIELDS = operator.attrgetter("entry_id", "title", "summary", "authors", "categories", "primary_category")
+
+
+def _result_fields(r: object) -> tuple[Any, ...]:
+    try:
+        # One C-level call builds the whole tuple for real arxiv.Result objects.
+        return _RESULT_FIELDS(r)
+    except AttributeError:
+        return (
+            getattr(r, "entry_id", ""),
+            getattr(r, "title", ""),
+            getattr(r, "summary", ""),
+            getattr(r, "authors", []),
+            getattr(r, "categories", []),
+            getattr(r, "primary_category", ""),
+        )
+
+
+def _to_candidate(r: object, updated: datetime) -> PaperCandidate:
+    entry_id, title, summary, authors, categories, primary_category = _result_fields(r)
     arxiv_id = getattr(r, "get_short_id", None)
     if callable(arxiv_id):
         pid = arxiv_id()
     else:
         pid = entry_id.rsplit("/", 1)[-1] if entry_id else ""
-    title = getattr(r, "title", "").strip().replace("\n", " ")
-    summary = getattr(r, "summary", "").strip().replace("\n", " ")
-    authors = [getattr(a, "name", str(a)) for a in getattr(r, "authors", [])][:3]
+    title = title.strip().replace("\n", " ")
+    summary = summary.strip().replace("\n", " ")
+    authors = [getattr(a, "name", str(a)) for a in authors][:3]
     affiliations = _extract_affiliations(r)
-    updated = getattr(r, "updated", None) or getattr(r, "published", None)
-    publish_date = _iso(updated) if isinstance(updated, datetime) else ""
-    categories = list(getattr(r, "categories", []) or [])
-    primary_category = getattr(r, "primary_category", "") or (categories[0] if categories else "")
-    return PaperCandidate(
+    # `updated` is the tz-aware timestamp the harvest loop already derived via _updated_at().
+    publish_date = updated.isoformat()
+    categories = list(categories or [])
+    primary_category = primary_category or (categories[0] if categories else "")
+    candidate = PaperCandidate(
         id=str(pid),
         title_en=title,
         authors=authors,
@@ -221,6 +251,78 @@ def _to_candidate(r: object) -> PaperCandidate:
         primary_category=str(primary_category),
         abstract=summary,
     )
+    candidate._search_text = (title, summary, f"{title}\n{summary}")
+    return candidate
+
+
+def _search_text(c: PaperCandidate) -> str:
+    """
+    Cached "title\nabstract" so repeated filter passes don't rebuild it per candidate. The memo
+    remembers the title/abstract it was built from: model_copy(update=...) carries private
+    attributes over, so a copy with a new title or abstract must not reuse it.
+    """
+    memo = c._search_text
+    if memo is not None and memo[0] == c.title_en and memo[1] == c.abstract:
+        return memo[2]
+    text = f"{c.title_en}\n{c.abstract}"
+    c._search_text = (c.title_en, c.abstract, text)
+    return text
+
+
+# Below this many keywords a compiled `re` alternation is already as fast as Hyperscan.
+_HYPERSCAN_MIN_KEYWORDS = 16
+
+
+class _HyperscanMatcher:
+    """Multi-literal matcher on a Hyperscan DFA; mirrors the `.search(text)` truthiness of re.Pattern."""
+
+    def __init__(self, hyperscan: Any, keywords: list[str]) -> None:
+        # UTF8 + UCP: Unicode semantics, as re uses for str patterns.
+        flags = (
+            hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+        )
+        self._scan_terminated = hyperscan.ScanTerminated
+        self._db = hyperscan.Database()
+        self._db.compile(
+            expressions=[re.escape(k).encode("utf-8") for k in keywords],
+            ids=list(range(len(keywords))),
+            elements=len(keywords),
+            flags=[flags] * len(keywords),
+        )
+
+    def search(self, text: str) -> bool:
+        def _on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> bool:
+            # Any hit answers the question; a truthy return stops the scan.
+            return True
+
+        try:
+            self._db.scan(text.encode("utf-8"), match_event_handler=_on_match)
+        except self._scan_terminated:
+            return True
+        return False
+
+
+def _compile_keywords(keywords: list[str]) -> re.Pattern[str] | _HyperscanMatcher | None:
+    """Compile keywords into one case-insensitive matcher (single C-level scan per text)."""
+    kept = tuple(k for k in keywords if k.strip())
+    if not kept:
+        return None
+    if len(kept) >= _HYPERSCAN_MIN_KEYWORDS:
+        try:
+            # Optional: python-hyperscan, when installed, for large keyword lists.
+            import hyperscan
+        except ImportError:
+            pass
+        else:
+            return _HyperscanMatcher(hyperscan, list(kept))
+    return _keyword_regex(kept)
+
+
+@functools.lru_cache(maxsize=32)
+def _keyword_regex(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    # Compiled patterns are immutable and thread-safe, so repeated runs share one per keyword list.
+    # (Hyperscan databases carry scan scratch state and are built per call instead.)
+    return re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE)
 
 
 def apply_keyword_heuristics(
@@ -228,15 +330,15 @@ def apply_keyword_heuristics(
     include: list[str],
     exclude: list[str],
 ) -> list[PaperCandidate]:
-    inc = [s.lower() for s in include if s.strip()]
-    exc = [s.lower() for s in exclude if s.strip()]
+    inc_re = _compile_keywords(include)
+    exc_re = _compile_keywords(exclude)
 
     out: list[PaperCandidate] = []
     for c in candidates:
-        text = f"{c.title_en}\n{c.abstract}".lower()
-        if exc and any(x in text for x in exc):
+        text = _search_text(c)
+        if exc_re is not None and exc_re.search(text):
             continue
-        if inc and not any(x in text for x in inc):
+        if inc_re is not None and not inc_re.search(text):
             continue
         out.append(c)
     return out
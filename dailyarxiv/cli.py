@@ -5,13 +5,14 @@ import json
 import sys
 from pathlib import Path
 
-from .config import load_settings
-from .pipeline import run_pipeline
-from .render.weasyprint_renderer import render_html_to_pdf_if_available
-from .render.renderer import render_report_html
+# Subcommand modules are imported inside each _cmd_* so e.g. `dailyarxiv db stats`
+# doesn't pay for the pipeline/httpx/jinja2/weasyprint imports it never uses.
 
 
 def _cmd_run(args: argparse.Namespace) -> int:
+    from .config import load_settings
+    from .pipeline import run_pipeline
+
     settings = load_settings(Path(args.config))
     if getattr(args, "template", None):
         settings.output.html_template = str(args.template)
@@ -27,6 +28,7 @@ def _cmd_run(args: argparse.Namespace) -> int:
         dry_run=args.dry_run,
         html_only=args.html_only,
         pdf_only=args.pdf_only,
+        force_trend=args.force_trend,
     )
 
     print(f"Report date: {result['report_date']}")
@@ -39,6 +41,9 @@ def _cmd_run(args: argparse.Namespace) -> int:
 
 
 def _cmd_render(args: argparse.Namespace) -> int:
+    from .render.renderer import render_report_html
+    from .render.weasyprint_renderer import render_html_to_pdf_if_available
+
     in_path = Path(args.input)
     out_dir = Path(args.out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -60,23 +65,23 @@ def _cmd_db(args: argparse.Namespace) -> int:
     from .archivist_sqlite import ArchivistSQLite
 
     db_path = Path(args.db)
-    arch = ArchivistSQLite(db_path)
-    if args.subcmd == "stats":
-        stats = arch.stats(days=args.days)
-        print(json.dumps(stats, ensure_ascii=False, indent=2))
-        return 0
-    if args.subcmd == "export":
-        payload = arch.export_report(date=args.date)
-        if args.format == "json":
-            text = json.dumps(payload, ensure_ascii=False, indent=2)
-            if args.out:
-                out_path = Path(args.out)
-                out_path.write_text(text, encoding="utf-8")
-                print(str(out_path))
-                return 0
-            sys.stdout.write(text)
+    with ArchivistSQLite(db_path) as arch:
+        if args.subcmd == "stats":
+            stats = arch.stats(days=args.days)
+            print(json.dumps(stats, ensure_ascii=False, indent=2))
             return 0
-        raise ValueError(f"Unsupported format: {args.format}")
+        if args.subcmd == "export":
+            payload = arch.export_report(date=args.date)
+            if args.format == "json":
+                text = json.dumps(payload, ensure_ascii=False, indent=2)
+                if args.out:
+                    out_path = Path(args.out)
+                    out_path.write_text(text, encoding="utf-8")
+                    print(str(out_path))
+                    return 0
+                sys.stdout.write(text)
+                return 0
+            raise ValueError(f"Unsupported format: {args.format}")
     raise ValueError(f"Unknown db subcmd: {args.subcmd}")
 
 
@@ -93,6 +98,11 @@ def main(argv: list[str] | None = None) -> int:
     p_run.add_argument("--dry-run", action="store_true", help="Only harvest; do not call LLM.")
     p_run.add_argument("--html-only", action="store_true")
     p_run.add_argument("--pdf-only", action="store_true")
+    p_run.add_argument(
+        "--force-trend",
+        action="store_true",
+        help="Regenerate weekly/monthly trend summaries even if their papers are unchanged.",
+    )
     p_run.add_argument(
         "--template",
         default=None,
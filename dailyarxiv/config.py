@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import copy
+import functools
 from pathlib import Path
 from typing import Any
 
@@ -7,6 +9,10 @@ import yaml
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# libyaml-backed loader/dumper when PyYAML was built with it; same semantics as safe_load/safe_dump.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class LLMSettings(BaseModel):
     api_key: str = ""
@@ -15,6 +21,15 @@ class LLMSettings(BaseModel):
     model_fast: str = "gemini-3-flash"
     model_smart: str = "gemini-3-flash"
     temperature: float = 0.0
+    # Max in-flight per-paper requests during filter/analyze.
+    concurrency: int = 4
+    # Reuse identical (model, prompt) responses from the SQLite archive for this long; 0 disables.
+    cache_ttl_secs: int = 7 * 24 * 3600
+    # true: fan out filter/analyze on one asyncio loop instead of a thread pool.
+    async_mode: bool = False
+    # Client-side pacing to stay under provider limits; 0 = unlimited.
+    rpm: int = 0
+    tpm: int = 0
 
 
 class SearchSettings(BaseModel):
@@ -32,6 +47,8 @@ class FilterSettings(BaseModel):
     relevance_threshold: int = 60
     max_selected: int = 20
     reviewer_mode: str = "fast_only"  # fast_only | fast_then_review
+    # >1: judge this many papers per LLM request; 0/1: one request per paper.
+    batch_size: int = 0
 
 
 class TrendSettings(BaseModel):
@@ -57,6 +74,16 @@ class OutputSettings(BaseModel):
     html_template: str = "editorial"
 
 
+class ArchiveSettings(BaseModel):
+    # Store archived payloads as zlib-compressed BLOBs (smaller DB; not readable by plain SQL JSON tooling).
+    compress_payloads: bool = False
+    # Reuse archived judgements/analyses for papers whose abstract, keywords, model and prompt
+    # version are unchanged. Off by default: every run asks the model afresh.
+    reuse_cached: bool = False
+    # synchronous=FULL: no committed run is lost on power failure, at the cost of an fsync per commit.
+    durable: bool = False
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="DAILYARXIV_", extra="ignore")
 
@@ -66,12 +93,21 @@ class Settings(BaseSettings):
     trend: TrendSettings = Field(default_factory=TrendSettings)
     spotlight: SpotlightSettings = Field(default_factory=SpotlightSettings)
     output: OutputSettings = Field(default_factory=OutputSettings)
+    archive: ArchiveSettings = Field(default_factory=ArchiveSettings)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    # mtime_ns/size are cache-key only: an edited file gets a fresh entry.
+    return yaml.load(Path(path).read_text(encoding="utf-8"), Loader=_YamlLoader) or {}
 
 
 def load_settings(config_path: Path) -> Settings:
     data: dict[str, Any] = {}
     if config_path.exists():
-        data = yaml.safe_load(config_path.read_text(encoding="utf-8")) or {}
+        st = config_path.stat()
+        # Deep-copy: Settings validation must never alias the cached dict.
+        data = copy.deepcopy(_load_yaml_cached(str(config_path.resolve()), st.st_mtime_ns, st.st_size))
     return Settings.model_validate(data)
 
 
@@ -82,6 +118,6 @@ def save_settings(config_path: Path, settings: Settings, *, include_api_key: boo
         data["llm"]["api_key"] = ""
     config_path.parent.mkdir(parents=True, exist_ok=True)
     config_path.write_text(
-        yaml.safe_dump(data, sort_keys=False, allow_unicode=True),
+        yaml.dump(data, Dumper=_YamlDumper, sort_keys=False, allow_unicode=True),
         encoding="utf-8",
     )
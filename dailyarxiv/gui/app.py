@@ -1,23 +1,32 @@
 from __future__ import annotations
 
+import http.server
 import json
 import os
-import queue
+import secrets
 import threading
 import time
+import urllib.parse
+from collections import deque
 from pathlib import Path
 from typing import Any
 
 import streamlit as st
 
 from dailyarxiv.archivist_sqlite import ArchivistSQLite
-from dailyarxiv.config import save_settings
+from dailyarxiv.config import Settings, save_settings
 from dailyarxiv.gui.forms import load_settings_or_default, settings_to_ui_dict, ui_dict_to_settings
 from dailyarxiv.gui.i18n import tr
-from dailyarxiv.gui.runner import drain_progress, run_in_background
+from dailyarxiv.gui.runner import ProgressChannel, drain_progress, format_progress_line, run_in_background
 
 
 APP_TITLE = "DailyArxiv GUI"
+_PROGRESS_LOG_LINES = 80
+_MAX_POLL_MS = 3000
+
+DEFAULT_CATEGORIES = ("cs.AI", "cs.CL", "cs.CV", "cs.LG", "cs.RO", "stat.ML")
+TEMPLATE_OPTIONS = ("editorial", "baseline", "modern", "compact")
+_TEMPLATE_INDEX = {name: i for i, name in enumerate(TEMPLATE_OPTIONS)}
 
 
 def main() -> int:
@@ -66,63 +75,78 @@ def _page_run() -> None:
     st.sidebar.subheader(tr(lang, "config"))
     default_cfg = "config.local.yaml" if Path("config.local.yaml").exists() else "config.yaml"
     config_path = st.sidebar.text_input(tr(lang, "config_path"), value=default_cfg)
-    settings = load_settings_or_default(config_path)
-    ui = settings_to_ui_dict(settings)
-
-    st.sidebar.subheader(tr(lang, "save_config"))
-    save_path = st.sidebar.text_input(tr(lang, "save_path"), value="config.local.yaml")
-    autosave_on_run = st.sidebar.checkbox(tr(lang, "autosave_on_run"), value=True)
-    save_api_key = st.sidebar.checkbox(tr(lang, "save_api_key"), value=False)
-
-    st.sidebar.subheader(tr(lang, "llm"))
-    st.sidebar.caption(tr(lang, "llm_caption"))
-    llm_api_key = st.sidebar.text_input(tr(lang, "api_key_session"), value="", type="password")
-    ui["llm"]["base_url"] = st.sidebar.text_input(tr(lang, "base_url"), value=ui["llm"].get("base_url", ""))
-    ui["llm"]["model_fast"] = st.sidebar.text_input(tr(lang, "model_fast"), value=ui["llm"].get("model_fast", "gemini-3-flash"))
-    ui["llm"]["model_smart"] = st.sidebar.text_input(tr(lang, "model_smart"), value=ui["llm"].get("model_smart", "gemini-3-flash"))
-    ui["llm"]["temperature"] = st.sidebar.slider(tr(lang, "temperature"), min_value=0.0, max_value=1.0, value=float(ui["llm"].get("temperature", 0.0)), step=0.1)
-
-    st.sidebar.subheader(tr(lang, "search"))
-    ui["search"]["categories"] = st.sidebar.multiselect(
+    ui = _load_ui_for(config_path)
+
+    if "job" not in st.session_state:
+        st.session_state.job = None
+    if "progress_q" not in st.session_state:
+        st.session_state.progress_q = ProgressChannel()
+    if "cancel" not in st.session_state:
+        st.session_state.cancel = threading.Event()
+    if "last_result" not in st.session_state:
+        st.session_state.last_result = None
+    if "progress_log" not in st.session_state:
+        st.session_state.progress_log = deque(maxlen=_PROGRESS_LOG_LINES)
+    if "progress_state" not in st.session_state:
+        st.session_state.progress_state = {"stage": "", "message": "", "done": None, "total": None}
+
+    # Config widgets live in one form so editing them does not rerun the page (and re-diff the
+    # whole sidebar) per keystroke; values apply on submit, which is why Run submits it too.
+    form = st.sidebar.form("cfg_form", clear_on_submit=False)
+    form.subheader(tr(lang, "save_config"))
+    save_path = form.text_input(tr(lang, "save_path"), value="config.local.yaml")
+    autosave_on_run = form.checkbox(tr(lang, "autosave_on_run"), value=True)
+    save_api_key = form.checkbox(tr(lang, "save_api_key"), value=False)
+
+    form.subheader(tr(lang, "llm"))
+    form.caption(tr(lang, "llm_caption"))
+    llm_api_key = form.text_input(tr(lang, "api_key_session"), value="", type="password")
+    ui["llm"]["base_url"] = form.text_input(tr(lang, "base_url"), value=ui["llm"].get("base_url", ""))
+    ui["llm"]["model_fast"] = form.text_input(tr(lang, "model_fast"), value=ui["llm"].get("model_fast", "gemini-3-flash"))
+    ui["llm"]["model_smart"] = form.text_input(tr(lang, "model_smart"), value=ui["llm"].get("model_smart", "gemini-3-flash"))
+    ui["llm"]["temperature"] = form.slider(tr(lang, "temperature"), min_value=0.0, max_value=1.0, value=float(ui["llm"].get("temperature", 0.0)), step=0.1)
+
+    form.subheader(tr(lang, "search"))
+    ui["search"]["categories"] = form.multiselect(
         tr(lang, "categories"),
-        options=_default_categories(),
+        options=DEFAULT_CATEGORIES,
         default=ui.get("search", {}).get("categories", []),
     )
-    ui["search"]["mode"] = st.sidebar.selectbox(
+    ui["search"]["mode"] = form.selectbox(
         tr(lang, "mode"),
         options=["latest_update_day", "fixed_window"],
         index=0 if ui["search"].get("mode") == "latest_update_day" else 1,
     )
-    ui["search"]["timezone"] = st.sidebar.text_input(tr(lang, "timezone"), value=ui["search"].get("timezone", "UTC"))
-    ui["search"]["lookback_days"] = st.sidebar.number_input(tr(lang, "lookback_days"), min_value=1, max_value=30, value=int(ui["search"].get("lookback_days", 7)))
-    ui["search"]["time_window_hours"] = st.sidebar.number_input(tr(lang, "time_window_hours"), min_value=1, max_value=168, value=int(ui["search"].get("time_window_hours", 24)))
-    ui["search"]["max_results"] = st.sidebar.number_input(tr(lang, "max_results"), min_value=1, max_value=500, value=int(ui["search"].get("max_results", 120)))
-
-    st.sidebar.subheader(tr(lang, "filter"))
-    ui["search"]["keywords_include"] = st.sidebar.text_area(tr(lang, "kw_include"), value="\n".join(ui["search"].get("keywords_include", []))).splitlines()
-    ui["search"]["keywords_exclude"] = st.sidebar.text_area(tr(lang, "kw_exclude"), value="\n".join(ui["search"].get("keywords_exclude", []))).splitlines()
-    ui["filter"]["relevance_threshold"] = st.sidebar.slider(tr(lang, "relevance_threshold"), min_value=0, max_value=100, value=int(ui["filter"].get("relevance_threshold", 60)))
-    ui["filter"]["max_selected"] = st.sidebar.number_input(tr(lang, "max_selected"), min_value=1, max_value=100, value=int(ui["filter"].get("max_selected", 20)))
-
-    st.sidebar.subheader(tr(lang, "trend"))
-    ui["trend"]["enable_weekly"] = st.sidebar.checkbox(tr(lang, "enable_weekly"), value=bool(ui["trend"].get("enable_weekly", True)))
-    ui["trend"]["enable_monthly"] = st.sidebar.checkbox(tr(lang, "enable_monthly"), value=bool(ui["trend"].get("enable_monthly", True)))
-    ui["trend"]["weekly_days"] = st.sidebar.number_input(tr(lang, "weekly_days"), min_value=1, max_value=60, value=int(ui["trend"].get("weekly_days", 7)))
-    ui["trend"]["monthly_days"] = st.sidebar.number_input(tr(lang, "monthly_days"), min_value=1, max_value=180, value=int(ui["trend"].get("monthly_days", 30)))
-    ui["trend"]["top_k_keywords"] = st.sidebar.number_input(tr(lang, "top_k_keywords"), min_value=5, max_value=100, value=int(ui["trend"].get("top_k_keywords", 20)))
-    ui["trend"]["chart_type"] = st.sidebar.selectbox(tr(lang, "chart_type"), options=["bar", "wordcloud"], index=0 if ui["trend"].get("chart_type") == "bar" else 1)
-
-    st.sidebar.subheader(tr(lang, "output"))
-    out_dir = st.sidebar.text_input(tr(lang, "out_dir"), value="reports")
-    template_options = ["editorial", "baseline", "modern", "compact"]
+    ui["search"]["timezone"] = form.text_input(tr(lang, "timezone"), value=ui["search"].get("timezone", "UTC"))
+    ui["search"]["lookback_days"] = form.number_input(tr(lang, "lookback_days"), min_value=1, max_value=30, value=int(ui["search"].get("lookback_days", 7)))
+    ui["search"]["time_window_hours"] = form.number_input(tr(lang, "time_window_hours"), min_value=1, max_value=168, value=int(ui["search"].get("time_window_hours", 24)))
+    ui["search"]["max_results"] = form.number_input(tr(lang, "max_results"), min_value=1, max_value=500, value=int(ui["search"].get("max_results", 120)))
+
+    form.subheader(tr(lang, "filter"))
+    ui["search"]["keywords_include"] = form.text_area(tr(lang, "kw_include"), value="\n".join(ui["search"].get("keywords_include", []))).splitlines()
+    ui["search"]["keywords_exclude"] = form.text_area(tr(lang, "kw_exclude"), value="\n".join(ui["search"].get("keywords_exclude", []))).splitlines()
+    ui["filter"]["relevance_threshold"] = form.slider(tr(lang, "relevance_threshold"), min_value=0, max_value=100, value=int(ui["filter"].get("relevance_threshold", 60)))
+    ui["filter"]["max_selected"] = form.number_input(tr(lang, "max_selected"), min_value=1, max_value=100, value=int(ui["filter"].get("max_selected", 20)))
+
+    form.subheader(tr(lang, "trend"))
+    ui["trend"]["enable_weekly"] = form.checkbox(tr(lang, "enable_weekly"), value=bool(ui["trend"].get("enable_weekly", True)))
+    ui["trend"]["enable_monthly"] = form.checkbox(tr(lang, "enable_monthly"), value=bool(ui["trend"].get("enable_monthly", True)))
+    ui["trend"]["weekly_days"] = form.number_input(tr(lang, "weekly_days"), min_value=1, max_value=60, value=int(ui["trend"].get("weekly_days", 7)))
+    ui["trend"]["monthly_days"] = form.number_input(tr(lang, "monthly_days"), min_value=1, max_value=180, value=int(ui["trend"].get("monthly_days", 30)))
+    ui["trend"]["top_k_keywords"] = form.number_input(tr(lang, "top_k_keywords"), min_value=5, max_value=100, value=int(ui["trend"].get("top_k_keywords", 20)))
+    ui["trend"]["chart_type"] = form.selectbox(tr(lang, "chart_type"), options=["bar", "wordcloud"], index=0 if ui["trend"].get("chart_type") == "bar" else 1)
+
+    form.subheader(tr(lang, "output"))
+    out_dir = form.text_input(tr(lang, "out_dir"), value="reports")
     current_template = str(ui["output"].get("html_template", "editorial") or "editorial")
-    template_index = template_options.index(current_template) if current_template in template_options else 0
-    ui["output"]["html_template"] = st.sidebar.selectbox(
+    ui["output"]["html_template"] = form.selectbox(
         tr(lang, "html_template"),
-        options=template_options,
-        index=template_index,
+        options=TEMPLATE_OPTIONS,
+        index=_TEMPLATE_INDEX.get(current_template, 0),
     )
-    ui["output"]["write_pdf"] = st.sidebar.checkbox(tr(lang, "write_pdf"), value=bool(ui["output"].get("write_pdf", True)))
+    ui["output"]["write_pdf"] = form.checkbox(tr(lang, "write_pdf"), value=bool(ui["output"].get("write_pdf", True)))
+    save_clicked = form.form_submit_button(tr(lang, "btn_save"))
+    run_btn = form.form_submit_button(tr(lang, "btn_run"), type="primary", disabled=st.session_state.job is not None)
 
     st.sidebar.subheader(tr(lang, "live"))
     refresh_ms = st.sidebar.slider(tr(lang, "auto_refresh_ms"), min_value=300, max_value=3000, value=800, step=100)
@@ -137,45 +161,30 @@ def _page_run() -> None:
     max_results = col4.number_input(tr(lang, "override_max_results"), min_value=0, max_value=1000, value=0)
     max_selected = col4.number_input(tr(lang, "override_max_selected"), min_value=0, max_value=200, value=0)
 
-    settings_obj = ui_dict_to_settings(ui)
-    if llm_api_key.strip():
-        settings_obj.llm.api_key = llm_api_key.strip()
-        ui.setdefault("llm", {})
-        ui["llm"]["api_key"] = llm_api_key.strip()
-
-    if st.sidebar.button(tr(lang, "btn_save")):
+    # The plain ui dict is what reruns carry around; only build (and validate) Settings when it
+    # is actually used.
+    if save_clicked:
         try:
-            save_settings(Path(save_path), settings_obj, include_api_key=save_api_key)
+            save_settings(Path(save_path), _settings_from_ui(ui, llm_api_key), include_api_key=save_api_key)
             st.sidebar.success(tr(lang, "saved_ok", path=str(save_path)))
         except Exception as e:
             st.sidebar.error(tr(lang, "saved_fail", error=str(e)))
 
-    if "job" not in st.session_state:
-        st.session_state.job = None
-    if "progress_q" not in st.session_state:
-        st.session_state.progress_q = queue.Queue()
-    if "cancel" not in st.session_state:
-        st.session_state.cancel = threading.Event()
-    if "last_result" not in st.session_state:
-        st.session_state.last_result = None
-    if "progress_log" not in st.session_state:
-        st.session_state.progress_log = []
-    if "progress_state" not in st.session_state:
-        st.session_state.progress_state = {"stage": "", "message": "", "done": None, "total": None}
-
-    run_btn = st.button(tr(lang, "btn_run"), type="primary", disabled=st.session_state.job is not None)
     cancel_btn = st.button(tr(lang, "btn_cancel"), disabled=st.session_state.job is None)
 
     if run_btn:
+        settings_obj = _settings_from_ui(ui, llm_api_key)
         if autosave_on_run:
             try:
                 save_settings(Path(save_path), settings_obj, include_api_key=save_api_key)
             except Exception as e:
                 st.sidebar.error(tr(lang, "saved_fail", error=str(e)))
                 st.stop()
-        st.session_state.cancel = threading.Event()
-        st.session_state.progress_q = queue.Queue()
-        st.session_state.progress_log = []
+        # Run is disabled while a job is alive, so no worker still holds these; reset in place.
+        st.session_state.cancel.clear()
+        st.session_state.progress_q.drain()
+        st.session_state.progress_log.clear()
+        st.session_state.pop("poll_delay_ms", None)
         thread = threading.Thread(
             target=_thread_entry,
             kwargs=dict(
@@ -205,6 +214,29 @@ def _page_run() -> None:
     _render_last_result()
 
 
+def _settings_from_ui(ui: dict[str, Any], llm_api_key: str) -> Settings:
+    settings = ui_dict_to_settings(ui)
+    if llm_api_key.strip():
+        settings.llm.api_key = llm_api_key.strip()
+    return settings
+
+
+def _load_ui_for(config_path: str) -> dict[str, Any]:
+    p = Path(config_path)
+    try:
+        st_ = p.stat()
+    except OSError:
+        return _load_ui(config_path, 0, -1)
+    return _load_ui(config_path, st_.st_mtime_ns, st_.st_size)
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def _load_ui(config_path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    # mtime_ns/size only key the cache. st.cache_data hands back a fresh copy on every hit,
+    # so callers may mutate the dict freely.
+    return settings_to_ui_dict(load_settings_or_default(config_path))
+
+
 def _thread_entry(**kwargs: Any) -> None:
     try:
         result = run_in_background(**kwargs)
@@ -228,12 +260,13 @@ def _render_progress(*, out_root: Path, refresh_ms: int) -> None:
                 st.session_state.last_result = {"error": ev[1]}
             st.session_state.job = None
             continue
-        st.session_state.progress_log.append(ev)
+        # Format once on arrival; the tail log is re-rendered on every rerun.
+        st.session_state.progress_log.append((ev, format_progress_line(ev)))
         st.session_state.progress_state = {
-            "stage": getattr(ev, "stage", ""),
-            "message": getattr(ev, "message", ""),
-            "done": getattr(ev, "done", None),
-            "total": getattr(ev, "total", None),
+            "stage": ev.stage,
+            "message": ev.message,
+            "done": ev.done,
+            "total": ev.total,
         }
 
     ps = st.session_state.progress_state
@@ -258,43 +291,129 @@ def _render_progress(*, out_root: Path, refresh_ms: int) -> None:
         pdf_path = latest_dir / "report.pdf"
         json_path = latest_dir / "daily_report.json"
         debug_path = latest_dir / "debug_candidates.json"
+        artifacts = _scan_files(latest_dir)
         lines = [f"{tr(lang, 'output_dir')}: {latest_dir}"]
         for p in [debug_path, json_path, html_path, pdf_path]:
-            if p.exists():
-                lines.append(f"- {p.name}: {p.stat().st_size} bytes")
+            if p.name in artifacts:
+                lines.append(f"- {p.name}: {artifacts[p.name].st_size} bytes")
         files_box.code("\n".join(lines), language="text")
-        if html_path.exists():
+        if html_path.name in artifacts:
             with st.expander(tr(lang, "live_html_preview"), expanded=False):
-                st.components.v1.html(html_path.read_text(encoding="utf-8"), height=600, scrolling=True)
+                _html_preview(html_path, artifacts[html_path.name].st_mtime_ns, height=600)
     else:
         files_box.caption(tr(lang, "no_progress"))
 
     # Show tail log
     if st.session_state.progress_log:
-        lines = []
-        for ev in st.session_state.progress_log[-80:]:
-            if getattr(ev, "done", None) is not None and getattr(ev, "total", None) is not None:
-                lines.append(f"[{ev.stage}] {ev.message} ({ev.done}/{ev.total})")
-            else:
-                lines.append(f"[{ev.stage}] {ev.message}")
-        st.code("\n".join(lines), language="text")
+        st.code("\n".join(line for _, line in st.session_state.progress_log), language="text")
 
     if st.session_state.job is not None:
-        time.sleep(max(0.2, refresh_ms / 1000.0))
+        # Back off while a slow stage emits nothing; snap back to refresh_ms on the next event.
+        if prog:
+            delay_ms = refresh_ms
+        else:
+            delay_ms = min(max(st.session_state.get("poll_delay_ms", refresh_ms), refresh_ms) * 2, _MAX_POLL_MS)
+        st.session_state.poll_delay_ms = delay_ms
+        time.sleep(max(0.2, delay_ms / 1000.0))
         st.rerun()
 
 
 def _guess_latest_out_dir(out_root: Path) -> Path | None:
+    # Polled on every rerun while a job runs: one scandir over the children. Their mtimes are the
+    # answer (a run writing into an existing report dir leaves out_root's own mtime unchanged), so
+    # there is nothing cheaper to key a cache on.
+    latest: Path | None = None
+    latest_mtime = -1
     try:
-        if not out_root.exists():
-            return None
-        dirs = [p for p in out_root.iterdir() if p.is_dir()]
-        if not dirs:
-            return None
-        dirs.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        return dirs[0]
-    except Exception:
+        with os.scandir(out_root) as it:
+            for entry in it:
+                if not entry.is_dir():
+                    continue
+                mtime = entry.stat().st_mtime_ns
+                if mtime > latest_mtime:
+                    latest, latest_mtime = Path(entry.path), mtime
+    except OSError:
         return None
+    return latest
+
+
+def _scan_files(d: Path) -> dict[str, os.stat_result]:
+    try:
+        with os.scandir(d) as it:
+            return {e.name: e.stat() for e in it if e.is_file()}
+    except OSError:
+        return {}
+
+
+def _read_html(path: Path) -> bytes:
+    return _read_html_cached(str(path), path.stat().st_mtime_ns)
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _read_html_cached(path: str, mtime_ns: int) -> bytes:
+    return Path(path).read_bytes()
+
+
+def _html_preview(html_path: Path, mtime_ns: int, *, height: int) -> None:
+    # The browser fetches the report from a loopback file server instead of Streamlit pushing
+    # the whole document over its websocket on every rerun. ?v= busts the browser cache when
+    # the file changes. The iframe URL is 127.0.0.1, so this only works when the browser runs on
+    # the GUI host (see README); otherwise the document is inlined as before.
+    try:
+        port = _preview_server()
+    except OSError:
+        st.components.v1.html(_read_html(html_path).decode("utf-8"), height=height, scrolling=True)
+        return
+    token = _preview_token(html_path)
+    st.components.v1.iframe(f"http://127.0.0.1:{port}/{token}?v={mtime_ns}", height=height, scrolling=True)
+
+
+# The server hands out only registered report files, each under an unguessable token: no
+# directory listing, and nothing else under out_root (config.local.yaml, the SQLite archive).
+_PREVIEW_FILES: dict[str, str] = {}
+_PREVIEW_TOKENS: dict[str, str] = {}
+_PREVIEW_LOCK = threading.Lock()
+
+
+def _preview_token(html_path: Path) -> str:
+    path = str(html_path.resolve())
+    with _PREVIEW_LOCK:
+        token = _PREVIEW_TOKENS.get(path)
+        if token is None:
+            token = _PREVIEW_TOKENS[path] = secrets.token_urlsafe(16)
+            _PREVIEW_FILES[token] = path
+    return token
+
+
+class _PreviewHandler(http.server.BaseHTTPRequestHandler):
+    def do_GET(self) -> None:
+        token = urllib.parse.urlsplit(self.path).path.strip("/")
+        with _PREVIEW_LOCK:
+            path = _PREVIEW_FILES.get(token)
+        try:
+            body = Path(path).read_bytes() if path is not None else None
+        except OSError:
+            body = None
+        if body is None:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@st.cache_resource(show_spinner=False)
+def _preview_server() -> int:
+    # One server thread per GUI process, shared by every report.
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), _PreviewHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server.server_address[1]
 
 
 def _compute_overall_progress(*, stage: str, done: int | None, total: int | None) -> float:
@@ -335,7 +454,7 @@ def _render_last_result() -> None:
 
     cols = st.columns(4)
     if html_path.exists():
-        cols[0].download_button(tr(lang, "download_html"), data=html_path.read_bytes(), file_name="report.html")
+        cols[0].download_button(tr(lang, "download_html"), data=_read_html(html_path), file_name="report.html")
     if pdf_path.exists():
         cols[1].download_button(tr(lang, "download_pdf"), data=pdf_path.read_bytes(), file_name="report.pdf")
     if json_path.exists():
@@ -345,7 +464,7 @@ def _render_last_result() -> None:
 
     if html_path.exists():
         st.subheader(tr(lang, "html_preview"))
-        st.components.v1.html(html_path.read_text(encoding="utf-8"), height=900, scrolling=True)
+        _html_preview(html_path, html_path.stat().st_mtime_ns, height=900)
 
 
 def _page_history() -> None:
@@ -357,22 +476,22 @@ def _page_history() -> None:
         st.info(tr(lang, "no_sqlite"))
         return
 
-    arch = ArchivistSQLite(p)
-    stats = arch.stats(days=60).get("recent_runs", [])
-    st.dataframe(stats, use_container_width=True)
+    with ArchivistSQLite(p) as arch:
+        stats = arch.stats(days=60).get("recent_runs", [])
+        st.dataframe(stats, use_container_width=True)
 
-    st.subheader(tr(lang, "export_by_date"))
-    date = st.text_input(tr(lang, "date_input"), value="")
-    if st.button(tr(lang, "btn_export_json")):
-        if not date.strip():
-            st.warning(tr(lang, "need_date"))
-        else:
-            payload = arch.export_report(date=date.strip())
-            st.download_button(
-                tr(lang, "download_exported_json"),
-                data=json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8"),
-                file_name="exported_report.json",
-            )
+        st.subheader(tr(lang, "export_by_date"))
+        date = st.text_input(tr(lang, "date_input"), value="")
+        if st.button(tr(lang, "btn_export_json")):
+            if not date.strip():
+                st.warning(tr(lang, "need_date"))
+            else:
+                payload = arch.export_report(date=date.strip())
+                st.download_button(
+                    tr(lang, "download_exported_json"),
+                    data=json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8"),
+                    file_name="exported_report.json",
+                )
 
     st.divider()
     st.subheader(tr(lang, "browse_reports"))
@@ -386,8 +505,8 @@ def _page_history() -> None:
             html_path = d / "report.html"
             pdf_path = d / "report.pdf"
             if html_path.exists():
-                st.download_button(tr(lang, "download_html"), data=html_path.read_bytes(), file_name=f"{chosen}-report.html")
-                st.components.v1.html(html_path.read_text(encoding="utf-8"), height=900, scrolling=True)
+                st.download_button(tr(lang, "download_html"), data=_read_html(html_path), file_name=f"{chosen}-report.html")
+                _html_preview(html_path, html_path.stat().st_mtime_ns, height=900)
             if pdf_path.exists():
                 st.download_button(tr(lang, "download_pdf"), data=pdf_path.read_bytes(), file_name=f"{chosen}-report.pdf")
     else:
@@ -409,17 +528,9 @@ def _page_about() -> None:
     st.markdown(tr(lang, "about_md"))
 
 
-def _default_categories() -> list[str]:
-    return [
-        "cs.AI",
-        "cs.CL",
-        "cs.CV",
-        "cs.LG",
-        "cs.RO",
-        "stat.ML",
-    ]
-
-
+# cache_resource rather than lru_cache: Streamlit re-executes this script on every rerun, which
+# would reset a module-level cache, and a failed weasyprint import is retried (slowly) each time.
+@st.cache_resource(show_spinner=False)
 def _weasyprint_ok() -> bool:
     try:
         from weasyprint import HTML  # noqa: F401
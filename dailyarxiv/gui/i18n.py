@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 from typing import Any
 
 
@@ -201,9 +202,14 @@ TRANSLATIONS: dict[str, dict[str, str]] = {
 }
 
 
-def tr(lang: str, key: str, **kwargs: Any) -> str:
+@functools.lru_cache(maxsize=4096)
+def _lookup(lang: str, key: str) -> str:
     table = TRANSLATIONS.get(lang) or TRANSLATIONS["zh"]
-    text = table.get(key) or TRANSLATIONS["zh"].get(key) or key
+    return table.get(key) or TRANSLATIONS["zh"].get(key) or key
+
+
+def tr(lang: str, key: str, **kwargs: Any) -> str:
+    text = _lookup(lang, key)
     if kwargs:
         try:
             return text.format(**kwargs)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import queue
 import threading
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Callable
@@ -10,7 +10,7 @@ from ..config import Settings
 from ..pipeline import run_pipeline
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProgressEvent:
     stage: str
     message: str
@@ -18,7 +18,27 @@ class ProgressEvent:
     total: int | None = None
 
 
-ProgressQueue = "queue.Queue[Any]"
+def format_progress_line(ev: ProgressEvent) -> str:
+    if ev.done is not None and ev.total is not None:
+        return f"[{ev.stage}] {ev.message} ({ev.done}/{ev.total})"
+    return f"[{ev.stage}] {ev.message}"
+
+
+class ProgressChannel:
+    """Worker-to-UI event buffer; the UI takes everything queued since the last poll at once."""
+
+    def __init__(self) -> None:
+        self._buf: deque[Any] = deque()
+        self._lock = threading.Lock()
+
+    def put(self, item: Any) -> None:
+        with self._lock:
+            self._buf.append(item)
+
+    def drain(self) -> list[Any]:
+        with self._lock:
+            out, self._buf = self._buf, deque()
+        return list(out)
 
 
 def run_in_background(
@@ -31,7 +51,7 @@ def run_in_background(
     dry_run: bool,
     html_only: bool,
     pdf_only: bool,
-    progress_q: ProgressQueue,
+    progress_q: ProgressChannel,
     cancel: threading.Event,
 ) -> dict[str, Any]:
     def progress_cb(stage: str, payload: dict[str, Any]) -> None:
@@ -58,10 +78,5 @@ def run_in_background(
     )
 
 
-def drain_progress(progress_q: ProgressQueue) -> list[ProgressEvent]:
-    items: list[Any] = []
-    while True:
-        try:
-            items.append(progress_q.get_nowait())
-        except queue.Empty:
-            return items
+def drain_progress(progress_q: ProgressChannel) -> list[ProgressEvent]:
+    return progress_q.drain()
@@ -1,19 +1,33 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
+import heapq
+import importlib.util
 import os
 import json
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, TypeVar
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Iterable, Sequence, TypeVar
 
 import time
 import httpx
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel, RootModel, ValidationError
 
 from .config import LLMSettings
 from .errors import CancelledError
 from .models import PaperAnalysis, PaperCandidate, RelevanceJudgement
 
 T = TypeVar("T", bound=BaseModel)
+R = TypeVar("R")
+
+# httpx only needs h2 for http2=True; probe without importing it.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
 
 
 @dataclass(frozen=True)
@@ -21,8 +35,72 @@ class LLMUsage:
     calls: int = 0
 
 
+_RELEVANCE_SYSTEM = (
+    "You are a senior AI researcher. "
+    "Judge whether a paper is relevant to user's interests based ONLY on the abstract and title. "
+    "Be strict and concise."
+)
+_ANALYSIS_SYSTEM = (
+    "You are a senior AI researcher and editor. "
+    "Read the abstract and produce a structured Chinese analysis. "
+    "Be specific, avoid fluff, and keep each field short as requested."
+)
+
+# Part of the archive reuse key: bump when a prompt or output schema changes, so judgements and
+# analyses written under the old one are produced afresh.
+PROMPT_VERSION = "1"
+
+# Shared by every candidate when no keywords are configured (RelevanceJudgement is frozen).
+_DEFAULT_JUDGEMENT = RelevanceJudgement(
+    is_relevant=True,
+    relevance_score=50,
+    matched_terms=(),
+    reason_cn="未设置关键词，默认按分区与时间纳入候选。",
+)
+
+# Sentinel for a response-cache miss (a cached value may legitimately be falsy).
+_MISS = object()
+
+
+class _IdentifiedJudgement(RelevanceJudgement):
+    id: str
+
+
+class _BatchJudgements(RootModel[list[_IdentifiedJudgement]]):
+    pass
+
+
 class LLMClient:
-    def __init__(self, api_key: str, base_url: str, model_fast: str, model_smart: str, temperature: float) -> None:
+    __slots__ = (
+        "_api_key",
+        "_base_url",
+        "_provider",
+        "_openai_client",
+        "_http",
+        "_model_fast",
+        "_model_smart",
+        "_temperature",
+        "_concurrency",
+        "_cache",
+        "_cache_ttl_secs",
+        "_rate",
+        "_gemini_urls",
+        "_gemini_headers",
+    )
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str,
+        model_fast: str,
+        model_smart: str,
+        temperature: float,
+        concurrency: int = 1,
+        cache: Any | None = None,
+        cache_ttl_secs: float = 0,
+        rpm: int = 0,
+        tpm: int = 0,
+    ) -> None:
         self._api_key = api_key or ""
         self._base_url = _normalize_base_url(base_url or "")
         self._provider = _detect_provider(self._base_url)
@@ -34,13 +112,23 @@ class LLMClient:
 
             self._openai_client = OpenAI(api_key=self._api_key or None, base_url=self._base_url or None)
 
-        self._http = httpx.Client(timeout=httpx.Timeout(120.0, connect=30.0))
+        # Keep enough warm connections for the per-paper fan-out (see _map_papers), and multiplex
+        # over HTTP/2 when the optional h2 package is installed.
+        self._http = httpx.Client(**_http_client_kwargs(concurrency))
         self._model_fast = model_fast
         self._model_smart = model_smart
         self._temperature = float(temperature)
+        self._concurrency = max(1, int(concurrency))
+        # Any object with get_llm_response/put_llm_response (e.g. ArchivistSQLite).
+        self._cache = cache if cache_ttl_secs > 0 else None
+        self._cache_ttl_secs = float(cache_ttl_secs)
+        self._rate = _RateLimit(rpm=rpm, tpm=tpm)
+        # Gemini request URLs (filled per model on first use) and headers never change per client.
+        self._gemini_urls: dict[str, str] = {}
+        self._gemini_headers = {"x-api-key": self._api_key}
 
     @classmethod
-    def from_settings(cls, s: LLMSettings) -> "LLMClient":
+    def from_settings(cls, s: LLMSettings, *, cache: Any | None = None) -> "LLMClient":
         if not s.api_key and not os.getenv("OPENAI_API_KEY") and not os.getenv("GEMINI_API_KEY"):
             raise ValueError("Missing LLM config: set llm.api_key or OPENAI_API_KEY or GEMINI_API_KEY.")
         return cls(
@@ -49,21 +137,67 @@ class LLMClient:
             model_fast=s.model_fast,
             model_smart=s.model_smart,
             temperature=s.temperature,
+            concurrency=s.concurrency,
+            cache=cache,
+            cache_ttl_secs=s.cache_ttl_secs,
+            rpm=s.rpm,
+            tpm=s.tpm,
         )
 
+    def close(self) -> None:
+        self._http.close()
+        if self._openai_client is not None:
+            self._openai_client.close()
+
+    def __enter__(self) -> "LLMClient":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
     def _chat_json(self, *, model: str, system: str, user: str, schema_hint: str) -> dict[str, Any]:
-        prompt = f"{user}\n\nReturn ONLY valid JSON.\nJSON schema hint:\n{schema_hint}"
+        return self._chat_parsed(model=model, system=system, user=user, schema_hint=schema_hint, parse=_safe_json_loads)
+
+    def _chat_parsed(self, *, model: str, system: str, user: str, schema_hint: str, parse: Callable[[str], R]) -> R:
+        prompt = _json_prompt(user, schema_hint)
+        key, hit = self._cache_get(model, system, prompt, parse)
+        if hit is not _MISS:
+            return hit
+        delay = self._rate.reserve(_estimate_tokens(system, prompt))
+        if delay > 0:
+            time.sleep(delay)
+        text = self._complete(model=model, system=system, prompt=prompt)
+        out = parse(text)
+        self._cache_put(key, text)
+        return out
+
+    def _cache_get(self, model: str, system: str, prompt: str, parse: Callable[[str], R]) -> tuple[bytes | None, Any]:
+        if self._cache is None:
+            return None, _MISS
+        key = _cache_key(self._provider, model, self._temperature, system, prompt)
+        cached = self._cache.get_llm_response(key, max_age_secs=self._cache_ttl_secs)
+        if cached is not None:
+            try:
+                return key, parse(cached)
+            except (ValidationError, json.JSONDecodeError):
+                pass
+        return key, _MISS
+
+    def _cache_put(self, key: bytes | None, text: str) -> None:
+        # Only called once a response parsed, so a bad answer is not replayed.
+        if key is not None and self._cache is not None:
+            self._cache.put_llm_response(key, text)
+
+    def _complete(self, *, model: str, system: str, prompt: str) -> str:
         if self._provider == "gemini_v1beta":
-            text = _gemini_generate_text(
+            return _gemini_generate_text(
                 http=self._http,
-                base_url=self._base_url,
-                api_key=self._api_key,
-                model=model,
+                url=self._gemini_url(model),
+                headers=self._gemini_headers,
                 system=system,
                 user=prompt,
                 temperature=self._temperature,
             )
-            return _safe_json_loads(text)
 
         if not self._openai_client:
             raise RuntimeError("OpenAI-compatible client not initialized.")
@@ -77,22 +211,61 @@ class LLMClient:
             temperature=self._temperature,
             messages=messages,
         )
-        content = resp.choices[0].message.content or ""
-        return _safe_json_loads(content)
+        return resp.choices[0].message.content or ""
+
+    def _gemini_url(self, model: str) -> str:
+        url = self._gemini_urls.get(model)
+        if url is None:
+            url = self._gemini_urls.setdefault(model, _gemini_url(self._base_url, self._api_key, model))
+        return url
 
     def _parse_or_repair(self, model: str, system: str, user: str, cls: type[T]) -> T:
-        schema_hint = cls.model_json_schema()
+        schema_hint = _schema_hint_for(cls)
+        parse = _model_parser(cls)
         try:
-            raw = self._chat_json(model=model, system=system, user=user, schema_hint=json.dumps(schema_hint))
-            return cls.model_validate(raw)
+            return self._chat_parsed(
+                model=model, system=system, user=user, schema_hint=schema_hint, parse=parse
+            )
         except (ValidationError, json.JSONDecodeError) as e:
-            repair_user = (
-                f"Your previous output was invalid.\nError: {e}\n\n"
-                f"Re-output ONLY valid JSON matching the schema exactly. No markdown.\n\n"
-                f"Original task:\n{user}"
+            return self._chat_parsed(
+                model=model, system=system, user=_repair_prompt(user, e), schema_hint=schema_hint, parse=parse
             )
-            raw2 = self._chat_json(model=model, system=system, user=repair_user, schema_hint=json.dumps(schema_hint))
-            return cls.model_validate(raw2)
+
+    def _map_concurrent(
+        self,
+        fn: Callable[[Any], R],
+        items: Sequence[Any],
+        *,
+        stage: str,
+        describe: Callable[[Any], str],
+        progress_cb: Any | None,
+        cancel: Any | None,
+    ) -> list[R]:
+        """Run fn over items on up to `concurrency` threads; results keep input order."""
+        total = len(items)
+        lock = threading.Lock()
+        done = 0
+
+        def run(item: Any) -> R:
+            nonlocal done
+            _raise_if_cancelled(cancel)
+            out = fn(item)
+            if progress_cb:
+                with lock:
+                    done += 1
+                    progress_cb(stage, describe(item), done, total)
+            return out
+
+        if self._concurrency <= 1 or total <= 1:
+            return [run(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self._concurrency, total)) as pool:
+            futures = [pool.submit(run, item) for item in items]
+            try:
+                return [f.result() for f in futures]
+            except BaseException:
+                for f in futures:
+                    f.cancel()
+                raise
 
     def filter_relevance(
         self,
@@ -104,61 +277,117 @@ class LLMClient:
         reviewer_mode: str,
         progress_cb: Any | None = None,
         cancel: Any | None = None,
+        known: dict[str, RelevanceJudgement] | None = None,
     ) -> dict[str, Any]:
+        """
+        Judge each candidate against `keywords` and select the most relevant. Candidates already in
+        `known` (e.g. judgements reused from the archive) are not sent to the model again.
+        """
         total = len(candidates)
 
-        if not [k for k in keywords if str(k).strip()]:
-            by_id: dict[str, RelevanceJudgement] = {}
-            all_judgements: list[RelevanceJudgement] = []
-            for i, c in enumerate(candidates, start=1):
-                if cancel is not None and hasattr(cancel, "is_set") and bool(cancel.is_set()):
-                    raise CancelledError("Cancelled")
-                j = RelevanceJudgement(
-                    is_relevant=True,
-                    relevance_score=50,
-                    matched_terms=[],
-                    reason_cn="未设置关键词，默认按分区与时间纳入候选。",
-                )
-                by_id[c.id] = j
-                all_judgements.append(j)
-                if progress_cb:
-                    progress_cb("filter", f"Judged {c.id}", i, total)
-            selected = sorted(candidates, key=lambda x: x.publish_date, reverse=True)[:max_selected]
+        if _should_short_circuit(keywords, cancel):
+            by_id: dict[str, RelevanceJudgement] = dict.fromkeys((c.id for c in candidates), _DEFAULT_JUDGEMENT)
+            all_judgements: list[RelevanceJudgement] = [_DEFAULT_JUDGEMENT] * total
+            if progress_cb:
+                progress_cb("filter", "default-judged", total, total)
+            selected = heapq.nlargest(max(0, max_selected), candidates, key=lambda x: x.publish_date)
             _ = reviewer_mode
             _ = threshold
             return {"by_id": by_id, "all_judgements": all_judgements, "selected": selected}
 
-        system = (
-            "You are a senior AI researcher. "
-            "Judge whether a paper is relevant to user's interests based ONLY on the abstract and title. "
-            "Be strict and concise."
+        todo = _unjudged(candidates, known)
+        fresh = self._map_concurrent(
+            lambda c: self._judge_one(c, keywords),
+            todo,
+            stage="filter",
+            describe=lambda c: f"Judged {c.id}",
+            progress_cb=progress_cb,
+            cancel=cancel,
         )
-        by_id: dict[str, RelevanceJudgement] = {}
-        all_judgements: list[RelevanceJudgement] = []
-        for i, c in enumerate(candidates, start=1):
-            if cancel is not None and hasattr(cancel, "is_set") and bool(cancel.is_set()):
-                raise CancelledError("Cancelled")
-            if progress_cb:
-                progress_cb("filter", f"Judging {c.id}", i, total)
-            user = (
-                f"User keywords: {keywords}\n\n"
-                f"Paper title: {c.title_en}\n"
-                f"Paper abstract: {c.abstract}\n\n"
-                "Decide relevance to the user keywords. "
-                "Return is_relevant, relevance_score (0-100), matched_terms, and a short Chinese reason (<=80 chars)."
+        by_id, all_judgements = _merge_judgements(candidates, known, zip(todo, fresh))
+
+        # reviewer_mode reserved (future): fast_then_review
+        _ = reviewer_mode
+
+        return _select_relevant(candidates, by_id, all_judgements, threshold=threshold, max_selected=max_selected)
+
+    def filter_relevance_batched(
+        self,
+        *,
+        candidates: list[PaperCandidate],
+        keywords: list[str],
+        max_selected: int,
+        threshold: int,
+        reviewer_mode: str,
+        batch_size: int = 20,
+        progress_cb: Any | None = None,
+        cancel: Any | None = None,
+        known: dict[str, RelevanceJudgement] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Same result as filter_relevance, but judges `batch_size` papers per request. Papers the
+        model leaves out of a batch reply are re-judged one by one.
+        """
+        if batch_size <= 1 or _should_short_circuit(keywords, cancel):
+            return self.filter_relevance(
+                candidates=candidates,
+                keywords=keywords,
+                max_selected=max_selected,
+                threshold=threshold,
+                reviewer_mode=reviewer_mode,
+                progress_cb=progress_cb,
+                cancel=cancel,
+                known=known,
             )
-            j = self._parse_or_repair(self._model_fast, system, user, RelevanceJudgement)
-            by_id[c.id] = j
-            all_judgements.append(j)
 
-        selected = [c for c in candidates if by_id[c.id].is_relevant and by_id[c.id].relevance_score >= threshold]
-        selected.sort(key=lambda x: (by_id[x.id].relevance_score, x.publish_date), reverse=True)
-        selected = selected[:max_selected]
+        todo = _unjudged(candidates, known)
+        batches = [todo[i : i + batch_size] for i in range(0, len(todo), batch_size)]
+        results = self._map_concurrent(
+            lambda batch: self._judge_batch(batch, keywords),
+            batches,
+            stage="filter",
+            describe=lambda batch: f"Judged {batch[0].id}..{batch[-1].id}",
+            progress_cb=progress_cb,
+            cancel=cancel,
+        )
+        got_by_id: dict[str, RelevanceJudgement] = dict(known or {})
+        for got in results:
+            got_by_id.update(got)
+        missing = [c for c in todo if c.id not in got_by_id]
+        if missing:
+            redo = self._map_concurrent(
+                lambda c: self._judge_one(c, keywords),
+                missing,
+                stage="filter",
+                describe=lambda c: f"Judged {c.id}",
+                progress_cb=progress_cb,
+                cancel=cancel,
+            )
+            got_by_id.update((c.id, j) for c, j in zip(missing, redo))
+        by_id, all_judgements = _merge_judgements(candidates, got_by_id, ())
 
-        # reviewer_mode reserved (future): fast_then_review
         _ = reviewer_mode
 
-        return {"by_id": by_id, "all_judgements": all_judgements, "selected": selected}
+        return _select_relevant(candidates, by_id, all_judgements, threshold=threshold, max_selected=max_selected)
+
+    def _judge_one(self, c: PaperCandidate, keywords: list[str]) -> RelevanceJudgement:
+        return self._parse_or_repair(self._model_fast, _RELEVANCE_SYSTEM, _relevance_prompt(c, keywords), RelevanceJudgement)
+
+    def _judge_batch(self, batch: list[PaperCandidate], keywords: list[str]) -> dict[str, RelevanceJudgement]:
+        papers = "\n\n".join(f"[{c.id}]\nTitle: {c.title_en}\nAbstract: {c.abstract}" for c in batch)
+        user = (
+            _FILTER_PROMPT_PREAMBLE.format(keywords=keywords) + f"Papers:\n{papers}\n\n"
+            "Decide relevance to the user keywords for EACH paper. "
+            "Return a JSON array with one object per paper: id (exactly as given in brackets), "
+            "is_relevant, relevance_score (0-100), matched_terms, and a short Chinese reason_cn (<=80 chars)."
+        )
+        try:
+            items = self._parse_or_repair(self._model_fast, _RELEVANCE_SYSTEM, user, _BatchJudgements).root
+        except (ValidationError, json.JSONDecodeError):
+            # The caller falls back to per-paper judgements for anything not returned.
+            return {}
+        wanted = {c.id for c in batch}
+        return {it.id: RelevanceJudgement.model_validate(it.model_dump(exclude={"id"})) for it in items if it.id in wanted}
 
     def analyze_papers(
         self,
@@ -167,47 +396,28 @@ class LLMClient:
         relevance_by_id: dict[str, RelevanceJudgement],
         progress_cb: Any | None = None,
         cancel: Any | None = None,
+        known: dict[str, PaperAnalysis] | None = None,
     ) -> list[PaperAnalysis]:
-        system = (
-            "You are a senior AI researcher and editor. "
-            "Read the abstract and produce a structured Chinese analysis. "
-            "Be specific, avoid fluff, and keep each field short as requested."
-        )
-        out: list[PaperAnalysis] = []
-        total = len(selected)
-        for i, c in enumerate(selected, start=1):
-            if cancel is not None and hasattr(cancel, "is_set") and bool(cancel.is_set()):
-                raise CancelledError("Cancelled")
-            if progress_cb:
-                progress_cb("analyze", f"Analyzing {c.id}", i, total)
+        """
+        Analyze each selected paper. Papers in `known` (e.g. analyses reused from the archive) are not
+        sent to the model again, but get this run's relevance like fresh ones.
+        """
+
+        def analyze(c: PaperCandidate) -> PaperAnalysis:
             j = relevance_by_id[c.id]
-            user = (
-                "Fill the fields for PaperAnalysis. Constraints:\n"
-                "- title_cn: Chinese translation of title\n"
-                "- summary_cn: Chinese translation of the abstract (do NOT add new info)\n"
-                "- motivation/method: <50 Chinese chars each\n"
-                "- paradigm_relation: describe relation to SOTA (Chinese)\n"
-                "- score: 1-5 based on novelty AND relevance\n\n"
-                "- affiliations: ONLY use affiliation_hints; if none, output [] (do NOT guess)\n\n"
-                f"Paper metadata:\n"
-                f"id={c.id}\n"
-                f"title_en={c.title_en}\n"
-                f"authors={c.authors}\n"
-                f"affiliation_hints={getattr(c, 'affiliations', [])}\n"
-                f"url={c.url}\n"
-                f"publish_date={c.publish_date}\n"
-                f"primary_category={c.primary_category}\n\n"
-                f"Abstract:\n{c.abstract}\n\n"
-                f"Relevance prior:\n{j.model_dump()}\n"
-            )
-            analysis = self._parse_or_repair(self._model_smart, system, user, PaperAnalysis)
-            # Ensure relevance matches our judgement (LLM may override)
-            analysis.relevance = j
-            analysis.affiliations = list(getattr(c, "affiliations", []) or [])
-            if not str(getattr(analysis, "summary_cn", "")).strip():
-                analysis.summary_cn = str(getattr(c, "abstract", "")).strip() or "（摘要翻译生成失败）"
-            out.append(analysis)
-        return out
+            analysis = (known or {}).get(c.id)
+            if analysis is None:
+                analysis = self._parse_or_repair(self._model_smart, _ANALYSIS_SYSTEM, _analysis_prompt(c, j), PaperAnalysis)
+            return _finish_analysis(analysis, c, j)
+
+        return self._map_concurrent(
+            analyze,
+            selected,
+            stage="analyze",
+            describe=lambda c: f"Analyzed {c.id}",
+            progress_cb=progress_cb,
+            cancel=cancel,
+        )
 
     def summarize_daily_trend(self, analyses: list[PaperAnalysis]) -> str:
         if not analyses:
@@ -229,22 +439,403 @@ class LLMClient:
         return summary or "（趋势总结生成失败）"
 
 
-def _safe_json_loads(text: str) -> dict[str, Any]:
+class AsyncLLMClient(LLMClient):
+    """
+    LLMClient whose per-paper filter/analyze fan-out runs on one asyncio event loop
+    (httpx.AsyncClient / AsyncOpenAI, bounded by a semaphore) instead of a thread pool.
+    The public methods stay synchronous: the client owns one event loop, and the async HTTP pool
+    bound to it, for all of its calls until close().
+    """
+
+    __slots__ = ("_loop", "_ahttp", "_aopenai")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._ahttp: httpx.AsyncClient | None = None
+        self._aopenai: Any | None = None
+
+    def close(self) -> None:
+        if self._loop is not None:
+            if self._ahttp is not None:
+                self._loop.run_until_complete(self._ahttp.aclose())
+            self._loop.run_until_complete(self._loop.shutdown_default_executor())
+            self._loop.close()
+            self._loop = self._ahttp = self._aopenai = None
+        super().close()
+
+    def filter_relevance(
+        self,
+        *,
+        candidates: list[PaperCandidate],
+        keywords: list[str],
+        max_selected: int,
+        threshold: int,
+        reviewer_mode: str,
+        progress_cb: Any | None = None,
+        cancel: Any | None = None,
+        known: dict[str, RelevanceJudgement] | None = None,
+    ) -> dict[str, Any]:
+        if _should_short_circuit(keywords, cancel):
+            return super().filter_relevance(
+                candidates=candidates,
+                keywords=keywords,
+                max_selected=max_selected,
+                threshold=threshold,
+                reviewer_mode=reviewer_mode,
+                progress_cb=progress_cb,
+                cancel=cancel,
+                known=known,
+            )
+
+        async def judge(c: PaperCandidate) -> RelevanceJudgement:
+            return await self._parse_or_repair_async(
+                self._model_fast, _RELEVANCE_SYSTEM, _relevance_prompt(c, keywords), RelevanceJudgement
+            )
+
+        todo = _unjudged(candidates, known)
+        fresh = self._run(
+            lambda: self._gather(
+                judge, todo, stage="filter", describe=lambda c: f"Judged {c.id}", progress_cb=progress_cb, cancel=cancel
+            )
+        )
+        by_id, all_judgements = _merge_judgements(candidates, known, zip(todo, fresh))
+        _ = reviewer_mode
+        return _select_relevant(candidates, by_id, all_judgements, threshold=threshold, max_selected=max_selected)
+
+    def analyze_papers(
+        self,
+        *,
+        selected: list[PaperCandidate],
+        relevance_by_id: dict[str, RelevanceJudgement],
+        progress_cb: Any | None = None,
+        cancel: Any | None = None,
+        known: dict[str, PaperAnalysis] | None = None,
+    ) -> list[PaperAnalysis]:
+        async def analyze(c: PaperCandidate) -> PaperAnalysis:
+            j = relevance_by_id[c.id]
+            analysis = (known or {}).get(c.id)
+            if analysis is None:
+                analysis = await self._parse_or_repair_async(
+                    self._model_smart, _ANALYSIS_SYSTEM, _analysis_prompt(c, j), PaperAnalysis
+                )
+            return _finish_analysis(analysis, c, j)
+
+        return self._run(
+            lambda: self._gather(
+                analyze, selected, stage="analyze", describe=lambda c: f"Analyzed {c.id}", progress_cb=progress_cb, cancel=cancel
+            )
+        )
+
+    def _run(self, make: Callable[[], Awaitable[R]]) -> R:
+        # Async clients are bound to the loop they were created on, so both live as long as the client.
+        async def main() -> R:
+            if self._ahttp is None:
+                self._ahttp = httpx.AsyncClient(**_http_client_kwargs(self._concurrency))
+                if self._provider == "openai_compat":
+                    from openai import AsyncOpenAI
+
+                    self._aopenai = AsyncOpenAI(
+                        api_key=self._api_key or None, base_url=self._base_url or None, http_client=self._ahttp
+                    )
+            return await make()
+
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(main())
+
+    async def _gather(
+        self,
+        fn: Callable[[Any], Awaitable[R]],
+        items: Sequence[Any],
+        *,
+        stage: str,
+        describe: Callable[[Any], str],
+        progress_cb: Any | None,
+        cancel: Any | None,
+    ) -> list[R]:
+        sem = asyncio.Semaphore(self._concurrency)
+        total = len(items)
+        done = 0
+
+        async def run(item: Any) -> R:
+            nonlocal done
+            async with sem:
+                _raise_if_cancelled(cancel)
+                out = await fn(item)
+            done += 1
+            if progress_cb:
+                progress_cb(stage, describe(item), done, total)
+            return out
+
+        tasks = [asyncio.ensure_future(run(item)) for item in items]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for t in tasks:
+                t.cancel()
+            raise
+
+    async def _parse_or_repair_async(self, model: str, system: str, user: str, cls: type[T]) -> T:
+        schema_hint = _schema_hint_for(cls)
+        parse = _model_parser(cls)
+        try:
+            return await self._chat_parsed_async(
+                model=model, system=system, user=user, schema_hint=schema_hint, parse=parse
+            )
+        except (ValidationError, json.JSONDecodeError) as e:
+            return await self._chat_parsed_async(
+                model=model, system=system, user=_repair_prompt(user, e), schema_hint=schema_hint, parse=parse
+            )
+
+    async def _chat_parsed_async(
+        self, *, model: str, system: str, user: str, schema_hint: str, parse: Callable[[str], R]
+    ) -> R:
+        prompt = _json_prompt(user, schema_hint)
+        # The SQLite cache is synchronous and lock-guarded: query it on a worker thread so a cache
+        # lookup does not stall the other in-flight requests on the loop.
+        key, hit = (None, _MISS)
+        if self._cache is not None:
+            key, hit = await asyncio.to_thread(self._cache_get, model, system, prompt, parse)
+        if hit is not _MISS:
+            return hit
+        delay = self._rate.reserve(_estimate_tokens(system, prompt))
+        if delay > 0:
+            await asyncio.sleep(delay)
+        text = await self._complete_async(model=model, system=system, prompt=prompt)
+        out = parse(text)
+        if key is not None:
+            await asyncio.to_thread(self._cache_put, key, text)
+        return out
+
+    async def _complete_async(self, *, model: str, system: str, prompt: str) -> str:
+        if self._provider == "gemini_v1beta":
+            r = await _post_with_retry_async(
+                self._ahttp,
+                self._gemini_url(model),
+                headers=self._gemini_headers,
+                payload=_gemini_payload(system, prompt, self._temperature),
+            )
+            r.raise_for_status()
+            return _gemini_response_text(r.json())
+
+        if not self._aopenai:
+            raise RuntimeError("OpenAI-compatible client not initialized.")
+        resp = await self._aopenai.chat.completions.create(
+            model=model,
+            temperature=self._temperature,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": prompt},
+            ],
+        )
+        return resp.choices[0].message.content or ""
+
+
+class _TokenBucket:
+    """Refills `per_minute` units per minute. reserve() may go into debt and returns the wait."""
+
+    def __init__(self, per_minute: int, *, clock: Callable[[], float] = time.monotonic) -> None:
+        self._rate = per_minute / 60.0
+        self._capacity = float(per_minute)
+        self._tokens = float(per_minute)
+        self._clock = clock
+        self._stamp = clock()
+
+    def reserve(self, n: float) -> float:
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._stamp) * self._rate)
+        self._stamp = now
+        self._tokens -= n
+        return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+
+class _RateLimit:
+    """Client-side requests/min and tokens/min pacing (0 disables either), shared by all workers."""
+
+    def __init__(self, *, rpm: int, tpm: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self._lock = threading.Lock()
+        self._rpm = _TokenBucket(rpm, clock=clock) if rpm > 0 else None
+        self._tpm = _TokenBucket(tpm, clock=clock) if tpm > 0 else None
+
+    def reserve(self, tokens: int) -> float:
+        """Claim one request worth `tokens`; returns how long the caller should wait before sending."""
+        if self._rpm is None and self._tpm is None:
+            return 0.0
+        with self._lock:
+            delay = 0.0
+            if self._rpm is not None:
+                delay = self._rpm.reserve(1)
+            if self._tpm is not None:
+                delay = max(delay, self._tpm.reserve(tokens))
+            return delay
+
+
+def _estimate_tokens(*texts: str) -> int:
+    # Rough prompt-size estimate (~4 chars per token); good enough for pacing.
+    return sum(len(t) for t in texts) // 4 + 1
+
+
+def _http_client_kwargs(concurrency: int) -> dict[str, Any]:
+    pool = max(1, int(concurrency))
+    return {
+        "timeout": httpx.Timeout(120.0, connect=30.0),
+        "limits": httpx.Limits(max_connections=max(100, pool * 2), max_keepalive_connections=max(20, pool)),
+        "http2": _HTTP2_AVAILABLE,
+    }
+
+
+def _json_prompt(user: str, schema_hint: str) -> str:
+    return f"{user}\n\nReturn ONLY valid JSON.\nJSON schema hint:\n{schema_hint}"
+
+
+def _repair_prompt(user: str, error: Exception) -> str:
+    return (
+        f"Your previous output was invalid.\nError: {error}\n\n"
+        f"Re-output ONLY valid JSON matching the schema exactly. No markdown.\n\n"
+        f"Original task:\n{user}"
+    )
+
+
+def _model_parser(cls: type[T]) -> Callable[[str], T]:
+    def parse(text: str) -> T:
+        # Single-pass parse + validate; no intermediate dict.
+        return cls.model_validate_json(_json_text(text, array=issubclass(cls, RootModel)))
+
+    return parse
+
+
+# Static prompt text, so per-paper prompts only format the fields that vary.
+_FILTER_PROMPT_PREAMBLE = "User keywords: {keywords}\n\n"
+_FILTER_PROMPT_INSTRUCTIONS = (
+    "Decide relevance to the user keywords. "
+    "Return is_relevant, relevance_score (0-100), matched_terms, and a short Chinese reason (<=80 chars)."
+)
+_ANALYZE_PROMPT_PREAMBLE = (
+    "Fill the fields for PaperAnalysis. Constraints:\n"
+    "- title_cn: Chinese translation of title\n"
+    "- summary_cn: Chinese translation of the abstract (do NOT add new info)\n"
+    "- motivation/method: <50 Chinese chars each\n"
+    "- paradigm_relation: describe relation to SOTA (Chinese)\n"
+    "- score: 1-5 based on novelty AND relevance\n\n"
+    "- affiliations: ONLY use affiliation_hints; if none, output [] (do NOT guess)\n\n"
+)
+
+
+def _relevance_prompt(c: PaperCandidate, keywords: list[str]) -> str:
+    return (
+        _FILTER_PROMPT_PREAMBLE.format(keywords=keywords)
+        + f"Paper title: {c.title_en}\nPaper abstract: {c.abstract}\n\n"
+        + _FILTER_PROMPT_INSTRUCTIONS
+    )
+
+
+def _analysis_prompt(c: PaperCandidate, j: RelevanceJudgement) -> str:
+    return _ANALYZE_PROMPT_PREAMBLE + (
+        f"Paper metadata:\n"
+        f"id={c.id}\n"
+        f"title_en={c.title_en}\n"
+        f"authors={c.authors}\n"
+        f"affiliation_hints={getattr(c, 'affiliations', [])}\n"
+        f"url={c.url}\n"
+        f"publish_date={c.publish_date}\n"
+        f"primary_category={c.primary_category}\n\n"
+        f"Abstract:\n{c.abstract}\n\n"
+        f"Relevance prior:\n{j.model_dump_json()}\n"
+    )
+
+
+def _finish_analysis(analysis: PaperAnalysis, c: PaperCandidate, j: RelevanceJudgement) -> PaperAnalysis:
+    # Ensure relevance matches our judgement (LLM may override)
+    analysis.relevance = j
+    analysis.affiliations = list(getattr(c, "affiliations", []) or [])
+    if not str(getattr(analysis, "summary_cn", "")).strip():
+        analysis.summary_cn = str(getattr(c, "abstract", "")).strip() or "（摘要翻译生成失败）"
+    return analysis
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_hint_for(cls: type[BaseModel]) -> str:
+    return json.dumps(cls.model_json_schema())
+
+
+def _select_relevant(
+    candidates: list[PaperCandidate],
+    by_id: dict[str, RelevanceJudgement],
+    all_judgements: list[RelevanceJudgement],
+    *,
+    threshold: int,
+    max_selected: int,
+) -> dict[str, Any]:
+    selected = [c for c in candidates if by_id[c.id].is_relevant and by_id[c.id].relevance_score >= threshold]
+    selected.sort(key=lambda x: (by_id[x.id].relevance_score, x.publish_date), reverse=True)
+    selected = selected[:max_selected]
+    return {"by_id": by_id, "all_judgements": all_judgements, "selected": selected}
+
+
+def _unjudged(candidates: list[PaperCandidate], known: dict[str, RelevanceJudgement] | None) -> list[PaperCandidate]:
+    if not known:
+        return candidates
+    return [c for c in candidates if c.id not in known]
+
+
+def _merge_judgements(
+    candidates: list[PaperCandidate],
+    known: dict[str, RelevanceJudgement] | None,
+    fresh: Iterable[tuple[PaperCandidate, RelevanceJudgement]],
+) -> tuple[dict[str, RelevanceJudgement], list[RelevanceJudgement]]:
+    """by_id and all_judgements in candidate order, from reused plus newly made judgements."""
+    pool = dict(known or {})
+    pool.update((c.id, j) for c, j in fresh)
+    all_judgements = [pool[c.id] for c in candidates]
+    return {c.id: j for c, j in zip(candidates, all_judgements)}, all_judgements
+
+
+def _cache_key(provider: str, model: str, temperature: float, system: str, prompt: str) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    for part in (provider, model, repr(temperature), system, prompt):
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.digest()
+
+
+def _should_short_circuit(keywords: list[str], cancel: Any | None) -> bool:
+    """
+    Checked first by the filter entry points: raises CancelledError if `cancel` is set, then returns
+    True when no keyword is configured (every candidate gets the default judgement, no LLM call).
+    """
+    _raise_if_cancelled(cancel)
+    return not [k for k in keywords if str(k).strip()]
+
+
+def _raise_if_cancelled(cancel: Any | None) -> None:
+    if cancel is not None and hasattr(cancel, "is_set") and bool(cancel.is_set()):
+        raise CancelledError("Cancelled")
+
+
+def _json_text(text: str, *, array: bool = False) -> str:
+    """Strip code fences / surrounding chatter from a model reply, leaving the JSON text.
+
+    ``array`` selects a top-level ``[...]`` block instead of ``{...}`` when the reply needs extracting.
+    """
     s = text.strip()
     # Handle cases where the model wraps JSON in code fences.
     if s.startswith("```"):
         s = s.strip("`")
         # remove optional leading 'json'
-        s = s.replace("json\n", "", 1)
-    try:
-        return json.loads(s)
-    except json.JSONDecodeError:
-        # Attempt to extract first {...} block.
-        start = s.find("{")
-        end = s.rfind("}")
+        s = s.replace("json\n", "", 1).strip()
+    opener, closer = ("[", "]") if array else ("{", "}")
+    if not (s.startswith(opener) and s.endswith(closer)):
+        # Attempt to extract the first {...} (or [...]) block.
+        start = s.find(opener)
+        end = s.rfind(closer)
         if start != -1 and end != -1 and end > start:
-            return json.loads(s[start : end + 1])
-        raise
+            s = s[start : end + 1]
+    return s
+
+
+def _safe_json_loads(text: str) -> dict[str, Any]:
+    return json.loads(_json_text(text))
 
 
 def _normalize_base_url(base_url: str) -> str:
@@ -269,9 +860,8 @@ _GEMINI_MODEL_ALIASES: dict[str, str] = {
 def _gemini_generate_text(
     *,
     http: httpx.Client,
-    base_url: str,
-    api_key: str,
-    model: str,
+    url: str,
+    headers: dict[str, str],
     system: str,
     user: str,
     temperature: float,
@@ -281,22 +871,31 @@ def _gemini_generate_text(
       POST {base_url}/v1beta/models/{model}:generateContent
       Header: x-api-key: <key>
     """
+    r = _post_with_retry(http, url, headers=headers, payload=_gemini_payload(system, user, temperature))
+    r.raise_for_status()
+    return _gemini_response_text(r.json())
+
+
+def _gemini_url(base_url: str, api_key: str, model: str) -> str:
     if not base_url:
         raise ValueError("Gemini provider requires llm.base_url.")
     if not api_key:
         raise ValueError("Gemini provider requires llm.api_key (or GEMINI_API_KEY/OPENAI_API_KEY env var).")
 
     m = _GEMINI_MODEL_ALIASES.get(model, model)
-    url = f"{base_url}/v1beta/models/{m}:generateContent"
-    payload = {
+    return f"{base_url}/v1beta/models/{m}:generateContent"
+
+
+def _gemini_payload(system: str, user: str, temperature: float) -> dict[str, Any]:
+    return {
         "contents": [
             {"role": "user", "parts": [{"text": f"{system}\n\n{user}"}]},
         ],
         "generationConfig": {"temperature": float(temperature)},
     }
-    r = _post_with_retry(http, url, api_key=api_key, payload=payload)
-    r.raise_for_status()
-    data = r.json()
+
+
+def _gemini_response_text(data: Any) -> str:
     try:
         parts = data["candidates"][0]["content"]["parts"]
         text = "".join(p.get("text", "") for p in parts if isinstance(p, dict))
@@ -305,13 +904,76 @@ def _gemini_generate_text(
         raise RuntimeError(f"Unexpected Gemini response shape: {data!r}")
 
 
-def _post_with_retry(http: httpx.Client, url: str, *, api_key: str, payload: dict[str, Any]) -> httpx.Response:
-    last_exc: Exception | None = None
-    for attempt in range(3):
+# Transient failures worth another attempt: dropped connections, rate limiting and gateway errors.
+_RETRY_EXCEPTIONS = (httpx.ReadTimeout, httpx.ConnectTimeout, httpx.RemoteProtocolError)
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_ATTEMPTS = 5
+# Longest server-requested wait worth sleeping through (the sleep does not observe cancel);
+# a longer Retry-After returns the 429/503 to the caller instead.
+_MAX_RETRY_DELAY_SECS = 60.0
+
+
+def _post_with_retry(
+    http: httpx.Client, url: str, *, headers: dict[str, str], payload: dict[str, Any]
+) -> httpx.Response:
+    for attempt in range(_RETRY_ATTEMPTS - 1):
         try:
-            return http.post(url, headers={"x-api-key": api_key}, json=payload)
-        except (httpx.ReadTimeout, httpx.ConnectTimeout, httpx.RemoteProtocolError) as e:
-            last_exc = e
-            time.sleep(1.5 * (2**attempt))
-    assert last_exc is not None
-    raise last_exc
+            r = http.post(url, headers=headers, json=payload)
+        except _RETRY_EXCEPTIONS:
+            time.sleep(_backoff_delay(attempt))
+            continue
+        if r.status_code not in _RETRY_STATUSES:
+            return r
+        delay = _retry_delay(attempt, r)
+        if delay is None:
+            return r
+        time.sleep(delay)
+    # Last attempt: errors propagate, and a 429/5xx is returned for the caller's raise_for_status().
+    return http.post(url, headers=headers, json=payload)
+
+
+async def _post_with_retry_async(
+    http: httpx.AsyncClient, url: str, *, headers: dict[str, str], payload: dict[str, Any]
+) -> httpx.Response:
+    for attempt in range(_RETRY_ATTEMPTS - 1):
+        try:
+            r = await http.post(url, headers=headers, json=payload)
+        except _RETRY_EXCEPTIONS:
+            await asyncio.sleep(_backoff_delay(attempt))
+            continue
+        if r.status_code not in _RETRY_STATUSES:
+            return r
+        delay = _retry_delay(attempt, r)
+        if delay is None:
+            return r
+        await asyncio.sleep(delay)
+    return await http.post(url, headers=headers, json=payload)
+
+
+def _retry_delay(attempt: int, response: httpx.Response) -> float | None:
+    """Server-requested Retry-After if present, else backoff; None when the server asks to wait too long."""
+    retry_after = _parse_retry_after(response.headers.get("retry-after"))
+    if retry_after is None:
+        return _backoff_delay(attempt)
+    return retry_after if retry_after <= _MAX_RETRY_DELAY_SECS else None
+
+
+def _backoff_delay(attempt: int) -> float:
+    # Exponential backoff with jitter so workers desync.
+    return 1.5 * (2**attempt) * random.uniform(0.5, 1.5)
+
+
+def _parse_retry_after(value: str | None) -> float | None:
+    # Either delay-seconds or an HTTP-date (RFC 9110 section 10.2.3).
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, when.timestamp() - time.time())
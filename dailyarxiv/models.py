@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class KeywordWeight(BaseModel):
@@ -21,11 +21,17 @@ class PaperCandidate(BaseModel):
     primary_category: str
     abstract: str
 
+    # (title, abstract, "title\nabstract") used by keyword filters; filled lazily, never serialized.
+    _search_text: tuple[str, str, str] | None = PrivateAttr(default=None)
+
 
 class RelevanceJudgement(BaseModel):
+    # Immutable: one judgement instance may be shared by several papers and analyses.
+    model_config = ConfigDict(frozen=True)
+
     is_relevant: bool
     relevance_score: int = Field(ge=0, le=100)
-    matched_terms: list[str] = Field(default_factory=list)
+    matched_terms: tuple[str, ...] = ()
     reason_cn: str
 
 
@@ -1,23 +1,42 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 from typing import Callable
 
+from pydantic import TypeAdapter
 from zoneinfo import ZoneInfo
 
-from .archivist_sqlite import ArchivistSQLite
+from .archivist_sqlite import ArchivistSQLite, abstract_sha1, reuse_key
 from .arxiv_client import apply_keyword_heuristics, harvest_candidates
 from .config import Settings
 from .errors import CancelledError
-from .llm_client import LLMClient
-from .models import DailyReport, PaperAnalysis, PaperCandidate, PeriodTrend
+from .llm_client import PROMPT_VERSION, AsyncLLMClient, LLMClient
+from .models import DailyReport, PaperAnalysis, PaperCandidate, PeriodTrend, RelevanceJudgement
 from .render.renderer import render_report_html
 from .render.weasyprint_renderer import render_html_to_pdf_if_available
 from .trends import build_bar_keywords, summarize_period_trend
 
+try:
+    # Optional: orjson pretty-prints the (large) debug payload much faster than the stdlib.
+    import orjson
+
+    def _dump_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+except ImportError:
+
+    def _dump_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+# One core traversal per list for the debug dump, instead of model_dump() per item.
+_CANDIDATES_ADAPTER = TypeAdapter(list[PaperCandidate])
+_JUDGEMENTS_ADAPTER = TypeAdapter(list[RelevanceJudgement])
+
 
 def run_pipeline(
     settings: Settings,
@@ -30,6 +49,7 @@ def run_pipeline(
     pdf_only: bool,
     progress_cb: Callable[[str, dict[str, Any]], None] | None = None,
     cancel: Any | None = None,
+    force_trend: bool = False,
 ) -> dict[str, Any]:
     tz = ZoneInfo(settings.search.timezone)
     generated_at = datetime.now(tz).isoformat()
@@ -67,9 +87,6 @@ def run_pipeline(
     out_dir = out_root / report_date
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    db_path = Path("dailyarxiv.sqlite")
-    arch = ArchivistSQLite(db_path)
-
     candidates = harvest.candidates
     candidates = apply_keyword_heuristics(
         candidates, settings.search.keywords_include, settings.search.keywords_exclude
@@ -82,133 +99,184 @@ def run_pipeline(
         "generated_at": generated_at,
         "source_range_start": harvest.source_range_start,
         "source_range_end": harvest.source_range_end,
-        "candidates": [c.model_dump() for c in candidates],
+        "candidates": _CANDIDATES_ADAPTER.dump_python(candidates),
     }
 
     if dry_run:
-        debug_candidates_path.write_text(json.dumps(debug_payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        debug_candidates_path.write_bytes(_dump_pretty(debug_payload))
         _progress("harvest", "Dry-run completed.")
         return {"report_date": report_date, "out_dir": str(out_dir)}
 
     _check_cancel()
-    llm = LLMClient.from_settings(settings.llm)
-
-    _progress("filter", "Filtering relevance…")
-    judgements = llm.filter_relevance(
-        candidates=candidates,
-        keywords=settings.search.keywords_include,
-        max_selected=max_selected_eff,
-        threshold=settings.filter.relevance_threshold,
-        reviewer_mode=settings.filter.reviewer_mode,
-        progress_cb=_progress,
-        cancel=cancel_event,
-    )
-    _progress("filter", f"Selected: {len(judgements['selected'])}/{len(candidates)}")
-    debug_payload["judgements"] = [j.model_dump() for j in judgements["all_judgements"]]
-    debug_payload["selected_ids"] = [c.id for c in judgements["selected"]]
-    debug_candidates_path.write_text(json.dumps(debug_payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    db_path = Path("dailyarxiv.sqlite")
+    llm_cls = AsyncLLMClient if settings.llm.async_mode else LLMClient
+    with ArchivistSQLite(
+        db_path, compress_payloads=settings.archive.compress_payloads, durable=settings.archive.durable
+    ) as arch, llm_cls.from_settings(settings.llm, cache=arch) as llm:
+        # Papers already judged/analyzed with the same abstract, keywords, model and prompt version
+        # are reused from the archive.
+        keywords = settings.search.keywords_include
+        sha_by_id = {c.id: abstract_sha1(c.abstract) for c in candidates}
+        judgement_key = reuse_key(keywords, model=settings.llm.model_fast, prompt_version=PROMPT_VERSION)
+        analysis_key = reuse_key(keywords, model=settings.llm.model_smart, prompt_version=PROMPT_VERSION)
+        reuse = settings.archive.reuse_cached
+        known_judgements = arch.get_cached_judgements(sha_by_id, reuse_key=judgement_key) if reuse else {}
 
-    _check_cancel()
-    _progress("analyze", "Analyzing selected papers…")
-    analyses: list[PaperAnalysis] = llm.analyze_papers(
-        selected=judgements["selected"],
-        relevance_by_id=judgements["by_id"],
-        progress_cb=_progress,
-        cancel=cancel_event,
-    )
+        _progress("filter", "Filtering relevance…")
+        if known_judgements:
+            _progress("filter", f"Reusing archived judgements: {len(known_judgements)}/{len(candidates)}")
+        judgements = llm.filter_relevance_batched(
+            candidates=candidates,
+            keywords=settings.search.keywords_include,
+            max_selected=max_selected_eff,
+            threshold=settings.filter.relevance_threshold,
+            reviewer_mode=settings.filter.reviewer_mode,
+            batch_size=settings.filter.batch_size,
+            progress_cb=_progress,
+            cancel=cancel_event,
+            known=known_judgements,
+        )
+        _progress("filter", f"Selected: {len(judgements['selected'])}/{len(candidates)}")
+        debug_payload["judgements"] = _JUDGEMENTS_ADAPTER.dump_python(judgements["all_judgements"])
+        debug_payload["selected_ids"] = [c.id for c in judgements["selected"]]
+        debug_candidates_path.write_bytes(_dump_pretty(debug_payload))
 
-    _check_cancel()
-    _progress("trend", "Summarizing daily trend…")
-    global_trend = llm.summarize_daily_trend(analyses)
+        _check_cancel()
+        _progress("analyze", "Analyzing selected papers…")
+        selected = judgements["selected"]
+        cached_analyses = (
+            arch.get_cached_analyses({c.id: sha_by_id[c.id] for c in selected}, reuse_key=analysis_key)
+            if reuse
+            else {}
+        )
+        if cached_analyses:
+            _progress("analyze", f"Reusing archived analyses: {len(cached_analyses)}/{len(selected)}")
+        analyses: list[PaperAnalysis] = llm.analyze_papers(
+            selected=selected,
+            relevance_by_id=judgements["by_id"],
+            progress_cb=_progress,
+            cancel=cancel_event,
+            known=cached_analyses,
+        )
 
-    weekly_trend: PeriodTrend | None = None
-    monthly_trend: PeriodTrend | None = None
+        _check_cancel()
+        _progress("trend", "Summarizing daily trend…")
+        global_trend = llm.summarize_daily_trend(analyses)
 
-    _check_cancel()
-    _progress("archive", "Writing to SQLite…")
-    run_id = arch.begin_run(
-        report_date=report_date,
-        generated_at=generated_at,
-        source_range_start=harvest.source_range_start,
-        source_range_end=harvest.source_range_end,
-        categories=settings.search.categories,
-        keywords=settings.search.keywords_include,
-        counts={"candidates": len(candidates), "selected": len(analyses)},
-    )
-    arch.write_candidates(run_id, candidates)
-    arch.write_judgements(run_id, judgements["by_id"])
-    arch.write_analyses(run_id, analyses)
+        weekly_trend: PeriodTrend | None = None
+        monthly_trend: PeriodTrend | None = None
 
-    if settings.trend.enable_weekly:
         _check_cancel()
-        _progress("trend", "Building weekly trend…")
-        weekly_items = arch.get_analyses_between(days=settings.trend.weekly_days, timezone=settings.search.timezone)
-        weekly_kw = build_bar_keywords(weekly_items, top_k=settings.trend.top_k_keywords)
-        weekly_summary = summarize_period_trend(llm, "week", weekly_items, timezone=settings.search.timezone)
-        weekly_trend = PeriodTrend(
-            period="week",
-            start_date=weekly_summary["start_date"],
-            end_date=weekly_summary["end_date"],
-            summary_cn=weekly_summary["summary_cn"],
-            keywords=weekly_kw,
-            chart_path=None,
-        )
-        arch.write_trend(run_id, weekly_trend)
+        _progress("archive", "Writing to SQLite…")
+        with arch.transaction():
+            run_id = arch.begin_run(
+                report_date=report_date,
+                generated_at=generated_at,
+                source_range_start=harvest.source_range_start,
+                source_range_end=harvest.source_range_end,
+                categories=settings.search.categories,
+                keywords=settings.search.keywords_include,
+                counts={"candidates": len(candidates), "selected": len(analyses)},
+            )
+            arch.write_candidates(run_id, candidates)
+            arch.write_judgements(
+                run_id, judgements["by_id"], abstract_sha1_by_id=sha_by_id, reuse_key=judgement_key
+            )
+            arch.write_analyses(run_id, analyses, abstract_sha1_by_id=sha_by_id, reuse_key=analysis_key)
 
-    if settings.trend.enable_monthly:
-        _check_cancel()
-        _progress("trend", "Building monthly trend…")
-        monthly_items = arch.get_analyses_between(days=settings.trend.monthly_days, timezone=settings.search.timezone)
-        monthly_kw = build_bar_keywords(monthly_items, top_k=settings.trend.top_k_keywords)
-        monthly_summary = summarize_period_trend(llm, "month", monthly_items, timezone=settings.search.timezone)
-        monthly_trend = PeriodTrend(
-            period="month",
-            start_date=monthly_summary["start_date"],
-            end_date=monthly_summary["end_date"],
-            summary_cn=monthly_summary["summary_cn"],
-            keywords=monthly_kw,
-            chart_path=None,
+        if settings.trend.enable_weekly:
+            _check_cancel()
+            _progress("trend", "Building weekly trend…")
+            weekly_items = arch.get_analyses_between(
+                days=settings.trend.weekly_days, timezone=settings.search.timezone
+            )
+            weekly_kw = build_bar_keywords(weekly_items, top_k=settings.trend.top_k_keywords)
+            weekly_summary = summarize_period_trend(
+                llm, "week", weekly_items, timezone=settings.search.timezone, cache=arch, force=force_trend
+            )
+            weekly_trend = PeriodTrend(
+                period="week",
+                start_date=weekly_summary["start_date"],
+                end_date=weekly_summary["end_date"],
+                summary_cn=weekly_summary["summary_cn"],
+                keywords=weekly_kw,
+                chart_path=None,
+            )
+            arch.write_trend(run_id, weekly_trend)
+
+        if settings.trend.enable_monthly:
+            _check_cancel()
+            _progress("trend", "Building monthly trend…")
+            monthly_items = arch.get_analyses_between(
+                days=settings.trend.monthly_days, timezone=settings.search.timezone
+            )
+            monthly_kw = build_bar_keywords(monthly_items, top_k=settings.trend.top_k_keywords)
+            monthly_summary = summarize_period_trend(
+                llm, "month", monthly_items, timezone=settings.search.timezone, cache=arch, force=force_trend
+            )
+            monthly_trend = PeriodTrend(
+                period="month",
+                start_date=monthly_summary["start_date"],
+                end_date=monthly_summary["end_date"],
+                summary_cn=monthly_summary["summary_cn"],
+                keywords=monthly_kw,
+                chart_path=None,
+            )
+            arch.write_trend(run_id, monthly_trend)
+
+        report = DailyReport(
+            date=report_date,
+            generated_at=generated_at,
+            source_range_start=harvest.source_range_start,
+            source_range_end=harvest.source_range_end,
+            domain="Computer Science",
+            categories=settings.search.categories,
+            keywords=settings.search.keywords_include,
+            global_trend=global_trend,
+            papers=analyses,
+            weekly_trend=weekly_trend,
+            monthly_trend=monthly_trend,
+            spotlight=[],
         )
-        arch.write_trend(run_id, monthly_trend)
-
-    report = DailyReport(
-        date=report_date,
-        generated_at=generated_at,
-        source_range_start=harvest.source_range_start,
-        source_range_end=harvest.source_range_end,
-        domain="Computer Science",
-        categories=settings.search.categories,
-        keywords=settings.search.keywords_include,
-        global_trend=global_trend,
-        papers=analyses,
-        weekly_trend=weekly_trend,
-        monthly_trend=monthly_trend,
-        spotlight=[],
-    )
 
-    daily_report_path = out_dir / "daily_report.json"
-    daily_report_path.write_text(
-        json.dumps(report.model_dump(), ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
-    arch.write_daily_report(run_id, report)
+        daily_report_path = out_dir / "daily_report.json"
+        html_path = out_dir / "report.html"
+        pdf_path = out_dir / "report.pdf"
+        want_pdf = not html_only and settings.output.write_pdf
 
-    html_path = out_dir / "report.html"
-    pdf_path = out_dir / "report.pdf"
+        # Render (HTML, then the slow PDF pass over it) in the background while the JSON and
+        # SQLite writes happen here.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            fut_html = None
+            if not pdf_only:
+                _progress("render", "Rendering HTML…")
+                fut_html = pool.submit(
+                    render_report_html, report, html_path, template_name=settings.output.html_template
+                )
 
-    if not pdf_only:
-        _progress("render", "Rendering HTML…")
-        render_report_html(report.model_dump(), html_path, template_name=settings.output.html_template)
-    if not html_only and settings.output.write_pdf:
-        _progress("render", "Rendering PDF…")
-        render_html_to_pdf_if_available(html_path, pdf_path)
-    _progress("render", "Done.")
+            def _render_pdf() -> None:
+                if fut_html is not None:
+                    fut_html.result()
+                # Reported from the worker, when the PDF pass actually starts.
+                _progress("render", "Rendering PDF…")
+                render_html_to_pdf_if_available(html_path, pdf_path)
 
-    return {
-        "report_date": report_date,
-        "out_dir": str(out_dir),
-        "html_path": str(html_path) if html_path.exists() else None,
-        "pdf_path": str(pdf_path) if pdf_path.exists() else None,
-        "db_path": str(db_path),
-        "run_id": run_id,
-    }
+            fut_pdf = pool.submit(_render_pdf) if want_pdf else None
+
+            daily_report_path.write_bytes(report.model_dump_json(indent=2).encode("utf-8"))
+            arch.write_daily_report(run_id, report)
+
+            if fut_html is not None:
+                fut_html.result()
+            if fut_pdf is not None:
+                fut_pdf.result()
+        _progress("render", "Done.")
+
+        return {
+            "report_date": report_date,
+            "out_dir": str(out_dir),
+            "html_path": str(html_path) if html_path.exists() else None,
+            "pdf_path": str(pdf_path) if pdf_path.exists() else None,
+            "db_path": str(db_path),
+            "run_id": run_id,
+        }
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from importlib import resources
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Mapping
 
-from jinja2 import Environment, select_autoescape
+from jinja2 import Environment, PackageLoader, Template
+from pydantic import BaseModel
 
 
 _TEMPLATES_BY_SHORT_NAME: dict[str, str] = {
@@ -14,20 +16,53 @@ _TEMPLATES_BY_SHORT_NAME: dict[str, str] = {
     "compact": "report_compact.html.j2",
 }
 
+# Shared across calls so each template is compiled once and then served from Jinja's cache.
+# Always autoescape: every template here is HTML, and select_autoescape() would not match a
+# "*.html.j2" name (string templates, as used before, were always escaped).
+# Packaged templates do not change while the process runs, so skip the per-lookup mtime check.
+_ENV = Environment(
+    loader=PackageLoader(__package__ or "dailyarxiv.render", "templates"),
+    autoescape=True,
+    auto_reload=False,
+    cache_size=400,
+)
 
-def render_report_html(report: dict[str, Any], out_path: Path, *, template_name: str = "editorial") -> None:
-    env = Environment(autoescape=select_autoescape(["html", "xml"]))
-    template_file = _resolve_template_name(template_name)
-    template = env.from_string(_load_text("templates", template_file))
-    html = template.render(report=report)
-    out_path.write_text(html, encoding="utf-8")
 
+def render_report_html(
+    report: BaseModel | Mapping[str, Any], out_path: Path, *, template_name: str = "editorial"
+) -> None:
+    # `report` may be a plain dict (e.g. loaded from daily_report.json) or a DailyReport model,
+    # which is rendered as-is (no model_dump()): the templates only use dotted access, which
+    # Jinja resolves the same way for attributes and keys.
+    _write_rendered(_ENV.get_template(_resolve_template_name(template_name)), report, out_path)
 
-def _load_text(*parts: str) -> str:
-    pkg = __package__ or "dailyarxiv.render"
-    return resources.files(pkg).joinpath(*parts).read_text(encoding="utf-8")
 
+def render_report_html_many(
+    report: BaseModel | Mapping[str, Any],
+    targets: Iterable[tuple[Path, str]],
+    *,
+    max_workers: int = 1,
+) -> None:
+    """
+    Render one report into several `(out_path, template_name)` targets. Every template is resolved
+    and compiled before the first write (an unknown name fails early), and the same `report`
+    object feeds each render. With max_workers > 1 the renders run on a thread pool.
+    """
+    jobs = [(_ENV.get_template(_resolve_template_name(name)), out_path) for out_path, name in targets]
+    if max_workers <= 1 or len(jobs) <= 1:
+        for template, out_path in jobs:
+            _write_rendered(template, report, out_path)
+        return
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as ex:
+        list(ex.map(lambda job: _write_rendered(job[0], report, job[1]), jobs))
 
+
+def _write_rendered(template: Template, report: BaseModel | Mapping[str, Any], out_path: Path) -> None:
+    # One encode and one write; also keeps "\n" line endings on every platform.
+    out_path.write_bytes(template.render(report=report).encode("utf-8"))
+
+
+@functools.lru_cache(maxsize=64)
 def _resolve_template_name(template_name: str) -> str:
     name = (template_name or "").strip()
     if not name:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import re
 from collections import Counter
 from datetime import datetime, timedelta
@@ -23,24 +24,32 @@ def build_bar_keywords(items: Iterable[PaperAnalysis], *, top_k: int) -> list[Ke
     """
     counter: Counter[str] = Counter()
     for a in items:
-        text = f"{a.method}\n{a.paradigm_relation}\n" + " ".join(a.relevance.matched_terms or [])
-        for w in _WORD_RE.findall(text):
-            key = w.strip().lower()
-            if len(key) < 3:
-                continue
-            counter[key] += 1
+        text = "\n".join((a.method, a.paradigm_relation, " ".join(a.relevance.matched_terms or [])))
+        # Matches are already >= 3 chars with no surrounding whitespace; lowercase the text once.
+        counter.update(_WORD_RE.findall(text.lower()))
 
     if not counter:
         return []
     most = counter.most_common(top_k)
-    max_v = float(most[0][1])
-    out: list[KeywordWeight] = []
-    for k, v in most:
-        out.append(KeywordWeight(keyword=k, weight=float(v) / max_v))
-    return out
+    # int / int is a correctly rounded true division, so the top keyword is exactly 1.0.
+    max_v = most[0][1]
+    return [KeywordWeight(keyword=k, weight=v / max_v) for k, v in most]
 
 
-def summarize_period_trend(llm: LLMClient, period: str, items: list[PaperAnalysis], timezone: str = "UTC") -> dict[str, Any]:
+def summarize_period_trend(
+    llm: LLMClient,
+    period: str,
+    items: list[PaperAnalysis],
+    timezone: str = "UTC",
+    *,
+    cache: Any | None = None,
+    force: bool = False,
+) -> dict[str, Any]:
+    """
+    `cache` (e.g. ArchivistSQLite) remembers the summary per (period, set of paper ids): when the
+    window holds the same papers as on a previous run, that summary is reused instead of calling
+    the smart model again. `force` always regenerates (and refreshes the cached entry).
+    """
     tz = ZoneInfo(timezone)
     end = datetime.now(tz).date().isoformat()
     if period == "week":
@@ -55,6 +64,19 @@ def summarize_period_trend(llm: LLMClient, period: str, items: list[PaperAnalysi
             "summary_cn": "（该时间范围内暂无历史入选论文）",
         }
 
+    content_hash = _items_hash(items)
+    if cache is not None and not force:
+        cached = cache.get_trend_summary(period, content_hash)
+        if cached is not None:
+            return {"start_date": start, "end_date": end, "summary_cn": cached}
+
     bullets = [f"{a.title_en}: {a.method} / {a.paradigm_relation}" for a in items]
     summary_cn = llm.summarize_period_trend(period, bullets, start, end)
+    if cache is not None:
+        cache.put_trend_summary(period, content_hash, summary_cn)
     return {"start_date": start, "end_date": end, "summary_cn": summary_cn}
+
+
+def _items_hash(items: Iterable[PaperAnalysis]) -> str:
+    ids = " | ".join(sorted(a.id for a in items))
+    return hashlib.blake2b(ids.encode("utf-8"), digest_size=16).hexdigest()
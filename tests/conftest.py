@@ -1,10 +1,23 @@
 from __future__ import annotations
 
+import shutil
 import sys
 from pathlib import Path
+from typing import Iterator
+
+import pytest
 
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+
+@pytest.fixture
+def work_dir(request: pytest.FixtureRequest) -> Iterator[Path]:
+    """Per-test scratch dir under the cwd (pyproject disables the tmpdir plugin); removed afterwards."""
+    work = Path(f"pytest_work_{request.node.name}")
+    shutil.rmtree(work, ignore_errors=True)
+    work.mkdir(parents=True)
+    yield work
+    shutil.rmtree(work, ignore_errors=True)
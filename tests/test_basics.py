@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-import shutil
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from pathlib import Path
 
-from dailyarxiv.archivist_sqlite import ArchivistSQLite
-from dailyarxiv.arxiv_client import apply_keyword_heuristics
+import httpx
+import pytest
+
+from dailyarxiv.archivist_sqlite import ArchivistSQLite, abstract_sha1, reuse_key
+from dailyarxiv.arxiv_client import _HyperscanMatcher, _keyword_regex, apply_keyword_heuristics
+from dailyarxiv import llm_client
+from dailyarxiv.llm_client import LLMClient, _json_text, _parse_retry_after, _post_with_retry
 from dailyarxiv.models import DailyReport, PaperAnalysis, PaperCandidate, RelevanceJudgement
 from dailyarxiv.render.renderer import render_report_html
-from dailyarxiv.trends import build_bar_keywords
+from dailyarxiv.trends import build_bar_keywords, summarize_period_trend
 
 
 def _candidate(pid: str, title: str, abstract: str) -> PaperCandidate:
@@ -43,6 +50,11 @@ def _analysis(pid: str) -> PaperAnalysis:
     )
 
 
+def _html_missing(path: Path, tokens: list[str]) -> list[str]:
+    html = path.read_text(encoding="utf-8")
+    return [t for t in tokens if t not in html]
+
+
 def test_apply_keyword_heuristics_include_exclude() -> None:
     c1 = _candidate("2502.1", "RAG paper", "We study retrieval augmented generation.")
     c2 = _candidate("2502.2", "Survey paper", "This is a survey of RAG.")
@@ -50,6 +62,34 @@ def test_apply_keyword_heuristics_include_exclude() -> None:
     assert [c.id for c in kept] == ["2502.1"]
 
 
+def test_hyperscan_matcher_agrees_with_keyword_regex() -> None:
+    hyperscan = pytest.importorskip("hyperscan")
+    keywords = ["rag", "kv cache", "c++", "mixture-of-experts", "Ångström", "ÉCLAIR"] + [f"term{i}" for i in range(12)]
+    matcher = _HyperscanMatcher(hyperscan, keywords)
+    regex = _keyword_regex(tuple(keywords))
+    texts = [
+        "We study RAG pipelines.",
+        "A KV Cache eviction policy.",
+        "Templates in C++ and MIXTURE-OF-EXPERTS routing.",
+        "ångström-scale imaging",
+        "Éclair: a benchmark",
+        "TERM11 appears here",
+        "Nothing relevant at all.",
+        "",
+    ]
+    assert [matcher.search(t) for t in texts] == [bool(regex.search(t)) for t in texts]
+
+
+def test_keyword_heuristics_see_updated_copies() -> None:
+    c = _candidate("2502.1", "RAG paper", "We study retrieval augmented generation.")
+    assert apply_keyword_heuristics([c], include=["rag"], exclude=["survey"]) == [c]
+    # model_copy keeps private attributes; the cached search text must follow the new title/abstract.
+    renamed = c.model_copy(update={"title_en": "A survey of RAG"})
+    assert apply_keyword_heuristics([renamed], include=["rag"], exclude=["survey"]) == []
+    rewritten = c.model_copy(update={"title_en": "Paper", "abstract": "Nothing here."})
+    assert apply_keyword_heuristics([rewritten], include=["rag"], exclude=[]) == []
+
+
 def test_build_bar_keywords_normalized() -> None:
     a1 = _analysis("2502.1")
     a2 = _analysis("2502.2")
@@ -61,56 +101,50 @@ def test_build_bar_keywords_normalized() -> None:
 
 
 def test_sqlite_archive_roundtrip() -> None:
-    work = Path("pytest_work_sqlite")
-    shutil.rmtree(work, ignore_errors=True)
-    work.mkdir(parents=True, exist_ok=True)
-    db = work / "dailyarxiv.sqlite"
-    arch = ArchivistSQLite(db)
-    run_id = arch.begin_run(
-        report_date="2026-02-18",
-        generated_at="2026-02-19T08:00:00+00:00",
-        source_range_start="2026-02-18T00:00:00+00:00",
-        source_range_end="2026-02-18T23:59:59+00:00",
-        categories=["cs.CL"],
-        keywords=["rag"],
-        counts={"candidates": 1, "selected": 1},
-    )
-    c = _candidate("2502.1", "RAG paper", "We study retrieval augmented generation.")
-    arch.write_candidates(run_id, [c])
+    arch = ArchivistSQLite(":memory:")
+    with arch.transaction():
+        run_id = arch.begin_run(
+            report_date="2026-02-18",
+            generated_at="2026-02-19T08:00:00+00:00",
+            source_range_start="2026-02-18T00:00:00+00:00",
+            source_range_end="2026-02-18T23:59:59+00:00",
+            categories=["cs.CL"],
+            keywords=["rag"],
+            counts={"candidates": 1, "selected": 1},
+        )
+        c = _candidate("2502.1", "RAG paper", "We study retrieval augmented generation.")
+        arch.write_candidates(run_id, [c])
 
-    j = RelevanceJudgement(is_relevant=True, relevance_score=90, matched_terms=["rag"], reason_cn="相关")
-    arch.write_judgements(run_id, {"2502.1": j})
+        j = RelevanceJudgement(is_relevant=True, relevance_score=90, matched_terms=["rag"], reason_cn="相关")
+        arch.write_judgements(run_id, {"2502.1": j})
 
-    a = _analysis("2502.1")
-    arch.write_analyses(run_id, [a])
+        a = _analysis("2502.1")
+        arch.write_analyses(run_id, [a])
 
-    report = DailyReport(
-        date="2026-02-18",
-        generated_at="2026-02-19T08:00:00+00:00",
-        source_range_start="2026-02-18T00:00:00+00:00",
-        source_range_end="2026-02-18T23:59:59+00:00",
-        domain="Computer Science",
-        categories=["cs.CL"],
-        keywords=["rag"],
-        global_trend="trend",
-        papers=[a],
-        weekly_trend=None,
-        monthly_trend=None,
-        spotlight=[],
-    )
-    arch.write_daily_report(run_id, report)
+        report = DailyReport(
+            date="2026-02-18",
+            generated_at="2026-02-19T08:00:00+00:00",
+            source_range_start="2026-02-18T00:00:00+00:00",
+            source_range_end="2026-02-18T23:59:59+00:00",
+            domain="Computer Science",
+            categories=["cs.CL"],
+            keywords=["rag"],
+            global_trend="trend",
+            papers=[a],
+            weekly_trend=None,
+            monthly_trend=None,
+            spotlight=[],
+        )
+        arch.write_daily_report(run_id, report)
 
     exported = arch.export_report(date="2026-02-18")
     assert exported["date"] == "2026-02-18"
     assert exported["papers"][0]["id"] == "2502.1"
-    shutil.rmtree(work, ignore_errors=True)
+    arch.close()
 
 
-def test_sqlite_get_analyses_between_backward_compat() -> None:
-    work = Path("pytest_work_sqlite_backward_compat")
-    shutil.rmtree(work, ignore_errors=True)
-    work.mkdir(parents=True, exist_ok=True)
-    db = work / "dailyarxiv.sqlite"
+def test_sqlite_get_analyses_between_backward_compat(work_dir: Path) -> None:
+    db = work_dir / "dailyarxiv.sqlite"
     arch = ArchivistSQLite(db)
     run_id = arch.begin_run(
         report_date="2026-02-18",
@@ -140,13 +174,259 @@ def test_sqlite_get_analyses_between_backward_compat() -> None:
     items = arch.get_analyses_between(days=60, timezone="UTC")
     assert items
     assert items[0].summary_cn
-    shutil.rmtree(work, ignore_errors=True)
 
 
-def test_render_html() -> None:
-    work = Path("pytest_work_render")
-    shutil.rmtree(work, ignore_errors=True)
-    work.mkdir(parents=True, exist_ok=True)
+def test_sqlite_compressed_payloads_roundtrip(work_dir: Path) -> None:
+    arch = ArchivistSQLite(work_dir / "dailyarxiv.sqlite", compress_payloads=True)
+    run_id = arch.begin_run(
+        report_date="2026-02-18",
+        generated_at="2026-02-19T08:00:00+00:00",
+        source_range_start="2026-02-18T00:00:00+00:00",
+        source_range_end="2026-02-18T23:59:59+00:00",
+        categories=["cs.CL"],
+        keywords=["rag"],
+        counts={"candidates": 1, "selected": 1},
+    )
+    a = _analysis("2502.1")
+    report = DailyReport(
+        date="2026-02-18",
+        generated_at="2026-02-19T08:00:00+00:00",
+        source_range_start="2026-02-18T00:00:00+00:00",
+        source_range_end="2026-02-18T23:59:59+00:00",
+        domain="Computer Science",
+        global_trend="trend",
+        papers=[a],
+    )
+    arch.write_daily_report(run_id, report)
+    exported = arch.export_report(date="2026-02-18")
+    assert exported["papers"][0]["summary_cn"] == "这是摘要的中文翻译。"
+    arch.close()
+
+
+def test_sqlite_multirow_writes_span_several_statements(work_dir: Path) -> None:
+    db = work_dir / "dailyarxiv.sqlite"
+    arch = ArchivistSQLite(db)
+    run_id = arch.begin_run(
+        report_date="2026-02-18",
+        generated_at="2026-02-19T08:00:00+00:00",
+        source_range_start="2026-02-18T00:00:00+00:00",
+        source_range_end="2026-02-18T23:59:59+00:00",
+        categories=["cs.CL"],
+        keywords=["rag"],
+        counts={"candidates": 1000, "selected": 0},
+    )
+    # 5 columns per judgement row: 199 rows per statement, so 1000 rows are 5 full chunks plus 5.
+    shas = {f"2502.{i}": abstract_sha1(f"abstract {i}") for i in range(1000)}
+    by_id = {
+        pid: RelevanceJudgement(is_relevant=i % 2 == 0, relevance_score=i % 101, reason_cn=f"理由{i}")
+        for i, pid in enumerate(shas)
+    }
+    key = reuse_key(["rag"], model="m", prompt_version="1")
+    arch.write_judgements(run_id, by_id, abstract_sha1_by_id=shas, reuse_key=key)
+
+    con = sqlite3.connect(db)
+    assert con.execute("SELECT COUNT(*) FROM judgements").fetchone() == (1000,)
+    con.close()
+    assert arch.get_cached_judgements(shas, reuse_key=key) == by_id
+    arch.close()
+
+
+def test_sqlite_transaction_rolls_back_on_error(work_dir: Path) -> None:
+    db = work_dir / "dailyarxiv.sqlite"
+    arch = ArchivistSQLite(db)
+    c = _candidate("2502.1", "RAG paper", "We study retrieval augmented generation.")
+    j = RelevanceJudgement(is_relevant=True, relevance_score=90, matched_terms=["rag"], reason_cn="相关")
+    with pytest.raises(RuntimeError, match="boom"):
+        with arch.transaction():
+            run_id = arch.begin_run(
+                report_date="2026-02-18",
+                generated_at="2026-02-19T08:00:00+00:00",
+                source_range_start="2026-02-18T00:00:00+00:00",
+                source_range_end="2026-02-18T23:59:59+00:00",
+                categories=["cs.CL"],
+                keywords=["rag"],
+                counts={"candidates": 1, "selected": 1},
+            )
+            arch.write_candidates(run_id, [c])
+            arch.write_judgements(run_id, {c.id: j})
+            arch.write_analyses(run_id, [_analysis(c.id)])
+            raise RuntimeError("boom")
+
+    assert arch.stats()["recent_runs"] == []
+    con = sqlite3.connect(db)
+    for table in ("runs", "candidates", "judgements", "analyses"):
+        assert con.execute(f"SELECT COUNT(*) FROM {table}").fetchone() == (0,)
+    # The connection is usable (and autocommitting) again afterwards.
+    arch.write_candidates("r", [c])
+    assert con.execute("SELECT COUNT(*) FROM candidates").fetchone() == (1,)
+    con.close()
+    arch.close()
+
+
+def test_sqlite_cached_judgements_match_abstract_and_keywords(work_dir: Path) -> None:
+    arch = ArchivistSQLite(work_dir / "dailyarxiv.sqlite")
+    run_id = arch.begin_run(
+        report_date="2026-02-18",
+        generated_at="2026-02-19T08:00:00+00:00",
+        source_range_start="2026-02-18T00:00:00+00:00",
+        source_range_end="2026-02-18T23:59:59+00:00",
+        categories=["cs.CL"],
+        keywords=["rag"],
+        counts={"candidates": 1, "selected": 1},
+    )
+    shas = {"2502.1": abstract_sha1("We study retrieval augmented generation.")}
+    key = reuse_key(["rag"], model="m", prompt_version="1")
+    j = RelevanceJudgement(is_relevant=True, relevance_score=90, matched_terms=["rag"], reason_cn="相关")
+    arch.write_judgements(run_id, {"2502.1": j}, abstract_sha1_by_id=shas, reuse_key=key)
+    arch.write_analyses(run_id, [_analysis("2502.1")], abstract_sha1_by_id=shas, reuse_key=key)
+
+    assert arch.get_cached_judgements(shas, reuse_key=key) == {"2502.1": j}
+    assert arch.get_cached_analyses(shas, reuse_key=key)["2502.1"].title_cn == "测试论文"
+    # Keyword order, case and padding do not change the key.
+    assert reuse_key([" RAG ", "rag"], model="m", prompt_version="1") == key
+    # A revised abstract, different keywords, another model or prompt version must not reuse the old result.
+    assert arch.get_cached_judgements({"2502.1": abstract_sha1("v2")}, reuse_key=key) == {}
+    assert arch.get_cached_analyses(shas, reuse_key=reuse_key(["kv cache"], model="m", prompt_version="1")) == {}
+    assert arch.get_cached_analyses(shas, reuse_key=reuse_key(["rag"], model="other", prompt_version="1")) == {}
+    assert arch.get_cached_analyses(shas, reuse_key=reuse_key(["rag"], model="m", prompt_version="2")) == {}
+
+    # The newest run wins, also when the lookup spans several statements.
+    later = arch.begin_run(
+        report_date="2026-02-19",
+        generated_at="2026-02-20T08:00:00+00:00",
+        source_range_start="2026-02-19T00:00:00+00:00",
+        source_range_end="2026-02-19T23:59:59+00:00",
+        categories=["cs.CL"],
+        keywords=["rag"],
+        counts={"candidates": 1, "selected": 1},
+    )
+    j2 = j.model_copy(update={"relevance_score": 70})
+    arch.write_judgements(later, {"2502.1": j2}, abstract_sha1_by_id=shas, reuse_key=key)
+    many = {f"2502.{i}": abstract_sha1(f"abstract {i}") for i in range(2, 1200)} | shas
+    assert arch.get_cached_judgements(many, reuse_key=key) == {"2502.1": j2}
+    arch.close()
+
+
+@pytest.mark.parametrize("compress_payloads", [False, True])
+def test_llm_response_cache_skips_repeat_calls(work_dir: Path, compress_payloads: bool) -> None:
+    arch = ArchivistSQLite(work_dir / "dailyarxiv.sqlite", compress_payloads=compress_payloads)
+    calls: list[str] = []
+
+    class FakeLLM(LLMClient):
+        def _complete(self, *, model: str, system: str, prompt: str) -> str:
+            calls.append(prompt)
+            return '{"global_trend": "趋势"}'
+
+    client = FakeLLM(
+        api_key="k",
+        base_url="https://example.invalid/gemini",
+        model_fast="m",
+        model_smart="m",
+        temperature=0.0,
+        cache=arch,
+        cache_ttl_secs=60,
+    )
+    a = _analysis("2502.1")
+    assert client.summarize_daily_trend([a]) == "趋势"
+    assert client.summarize_daily_trend([a]) == "趋势"
+    assert len(calls) == 1
+    assert arch.get_llm_response(b"missing", max_age_secs=60) is None
+    arch.close()
+
+
+def test_analyze_papers_reattaches_current_relevance_to_known() -> None:
+    class FakeLLM(LLMClient):
+        def _complete(self, *, model: str, system: str, prompt: str) -> str:
+            raise AssertionError("known analyses must not reach the model")
+
+    client = FakeLLM(
+        api_key="k", base_url="https://example.invalid/gemini", model_fast="m", model_smart="m", temperature=0.0
+    )
+    c = _candidate("2502.1", "RAG paper", "We study retrieval augmented generation.")
+    j = RelevanceJudgement(is_relevant=True, relevance_score=77, matched_terms=["rag"], reason_cn="本次")
+    [a] = client.analyze_papers(selected=[c], relevance_by_id={c.id: j}, known={c.id: _analysis(c.id)})
+    assert a.relevance == j
+
+
+def test_json_text_prefers_object_unless_array_expected() -> None:
+    reply = 'Result [v1]: {"global_trend": "x"}'
+    assert _json_text(reply) == '{"global_trend": "x"}'
+    assert _json_text('```json\n{"a": [1]}\n```') == '{"a": [1]}'
+    assert _json_text('Items: [{"id": "a"}]', array=True) == '[{"id": "a"}]'
+
+
+def test_parse_retry_after() -> None:
+    assert _parse_retry_after("7") == 7.0
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    assert 25.0 < _parse_retry_after(format_datetime(when, usegmt=True)) <= 30.0
+    assert _parse_retry_after(format_datetime(when - timedelta(hours=1), usegmt=True)) == 0.0
+    assert _parse_retry_after("soon") is None
+    assert _parse_retry_after(None) is None
+
+
+def _retry_client(statuses: list[tuple[int, dict[str, str]]]) -> tuple[httpx.Client, list[int]]:
+    seen: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status, headers = statuses[len(seen)]
+        seen.append(status)
+        return httpx.Response(status, headers=headers, json={})
+
+    return httpx.Client(transport=httpx.MockTransport(handler)), seen
+
+
+def test_post_with_retry_honours_retry_after(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(llm_client.time, "sleep", sleeps.append)
+    http, seen = _retry_client([(429, {"retry-after": "2"}), (503, {}), (200, {})])
+    r = _post_with_retry(http, "https://example.invalid/v1", headers={}, payload={})
+    assert r.status_code == 200
+    assert seen == [429, 503, 200]
+    assert sleeps[0] == 2.0 and len(sleeps) == 2
+
+    # A Retry-After beyond the cap is handed back instead of slept through.
+    sleeps.clear()
+    http, seen = _retry_client([(429, {"retry-after": "3600"}), (200, {})])
+    r = _post_with_retry(http, "https://example.invalid/v1", headers={}, payload={})
+    assert r.status_code == 429
+    assert seen == [429] and sleeps == []
+
+    # Persistent failures stop after the last attempt with the final response.
+    http, seen = _retry_client([(500, {})] * llm_client._RETRY_ATTEMPTS)
+    r = _post_with_retry(http, "https://example.invalid/v1", headers={}, payload={})
+    assert r.status_code == 500
+    assert len(seen) == llm_client._RETRY_ATTEMPTS
+
+
+def test_period_trend_summary_cache(work_dir: Path) -> None:
+    calls: list[list[str]] = []
+
+    class FakeLLM(LLMClient):
+        def summarize_period_trend(self, period: str, bullets: list[str], start_date: str, end_date: str) -> str:
+            calls.append(bullets)
+            return f"总结{len(calls)}"
+
+    client = FakeLLM(
+        api_key="k", base_url="https://example.invalid/gemini", model_fast="m", model_smart="m", temperature=0.0
+    )
+    arch = ArchivistSQLite(work_dir / "dailyarxiv.sqlite")
+    items = [_analysis("2502.1"), _analysis("2502.2")]
+
+    assert summarize_period_trend(client, "week", items, cache=arch)["summary_cn"] == "总结1"
+    # Same set of papers (in any order): served from the cache.
+    assert summarize_period_trend(client, "week", items[::-1], cache=arch)["summary_cn"] == "总结1"
+    assert len(calls) == 1
+    # Another period or a changed set of papers is a miss.
+    assert summarize_period_trend(client, "month", items, cache=arch)["summary_cn"] == "总结2"
+    assert summarize_period_trend(client, "week", items + [_analysis("2502.3")], cache=arch)["summary_cn"] == "总结3"
+    # force (--force-trend) regenerates and refreshes the cached entry.
+    assert summarize_period_trend(client, "week", items, cache=arch, force=True)["summary_cn"] == "总结4"
+    assert summarize_period_trend(client, "week", items, cache=arch)["summary_cn"] == "总结4"
+    assert len(calls) == 4
+    arch.close()
+
+
+def test_render_html(work_dir: Path) -> None:
     a = _analysis("2502.1")
     report = DailyReport(
         date="2026-02-18",
@@ -162,14 +442,7 @@ def test_render_html() -> None:
         monthly_trend=None,
         spotlight=[],
     )
-    out = work / "report.html"
-    render_report_html(report.model_dump(), out)
-    html = out.read_text(encoding="utf-8")
-    assert "精选论文" in html
-    assert "Global Trend" in html
-    assert "DailyArxiv" in html
-    assert "Test University" in html
-    assert "这是摘要的中文翻译。" in html
-    assert "arXiv:" in html
-    assert "2502.1" in html
-    shutil.rmtree(work, ignore_errors=True)
+    out = work_dir / "report.html"
+    render_report_html(report, out)
+    tokens = ["精选论文", "Global Trend", "DailyArxiv", "Test University", "这是摘要的中文翻译。", "arXiv:", "2502.1"]
+    assert _html_missing(out, tokens) == []
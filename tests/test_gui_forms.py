@@ -4,7 +4,7 @@ import threading
 
 from dailyarxiv.config import Settings
 from dailyarxiv.gui.forms import settings_to_ui_dict, ui_dict_to_settings
-from dailyarxiv.llm_client import LLMClient
+from dailyarxiv.llm_client import LLMClient, _should_short_circuit
 from dailyarxiv.models import PaperCandidate
 from dailyarxiv.errors import CancelledError
 
@@ -18,13 +18,23 @@ def test_settings_ui_roundtrip() -> None:
 
 def test_cancel_in_keywordless_filter_branch() -> None:
     # This branch must not call network; it should honor cancel immediately.
-    client = object.__new__(LLMClient)  # bypass __init__
-    # monkeypatch required fields used in branch
-    client._model_fast = "x"
-    client._model_smart = "x"
-    client._temperature = 0.0
-    client._provider = "gemini_v1beta"
+    cancel = threading.Event()
+    cancel.set()
+    try:
+        _should_short_circuit([], cancel)
+        assert False, "Expected CancelledError"
+    except CancelledError:
+        assert True
+    assert _should_short_circuit([" "], None) is True
+    assert _should_short_circuit(["rag"], None) is False
 
+    client = LLMClient(
+        api_key="k",
+        base_url="https://example.invalid/gemini",
+        model_fast="x",
+        model_smart="x",
+        temperature=0.0,
+    )
     candidates = [
         PaperCandidate(
             id="1",
@@ -37,8 +47,6 @@ def test_cancel_in_keywordless_filter_branch() -> None:
             abstract="abs",
         )
     ]
-    cancel = threading.Event()
-    cancel.set()
     try:
         client.filter_relevance(
             candidates=candidates,
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import threading
+from pathlib import Path
+
+import httpx
+import pytest
+
+from dailyarxiv import llm_client
+from dailyarxiv.archivist_sqlite import ArchivistSQLite
+from dailyarxiv.errors import CancelledError
+from dailyarxiv.llm_client import AsyncLLMClient, LLMClient, _RateLimit
+from dailyarxiv.models import PaperCandidate
+
+
+def _candidate(pid: str) -> PaperCandidate:
+    return PaperCandidate(
+        id=pid,
+        title_en=f"Paper {pid}",
+        authors=["A"],
+        url=f"https://arxiv.org/abs/{pid}",
+        publish_date="2026-02-18T12:00:00+00:00",
+        categories=["cs.CL"],
+        primary_category="cs.CL",
+        abstract=f"Abstract {pid} about RAG.",
+    )
+
+
+def _gemini_reply(text: str) -> httpx.Response:
+    return httpx.Response(200, json={"candidates": [{"content": {"parts": [{"text": text}]}}]})
+
+
+@pytest.fixture
+def gemini_requests(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Route the clients' HTTP through a MockTransport that judges "Paper <n>" with score n."""
+    seen: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        prompt = json.loads(request.content)["contents"][0]["parts"][0]["text"]
+        n = int(re.search(r"Paper title: Paper (\d+)", prompt).group(1))
+        seen.append(str(n))
+        # Later papers answer first, so completion order differs from input order.
+        await asyncio.sleep(0.01 * (10 - n))
+        judgement = {"is_relevant": True, "relevance_score": n, "matched_terms": ["rag"], "reason_cn": "相关"}
+        return _gemini_reply(json.dumps(judgement))
+
+    monkeypatch.setattr(
+        llm_client, "_http_client_kwargs", lambda concurrency: {"transport": httpx.MockTransport(handler)}
+    )
+    return seen
+
+
+def _client(**kwargs: object) -> AsyncLLMClient:
+    return AsyncLLMClient(
+        api_key="k",
+        base_url="https://example.invalid/gemini",
+        model_fast="m",
+        model_smart="m",
+        temperature=0.0,
+        **kwargs,
+    )
+
+
+def _filter(client: AsyncLLMClient, candidates: list[PaperCandidate], **kwargs: object) -> dict:
+    return client.filter_relevance(
+        candidates=candidates,
+        keywords=["rag"],
+        max_selected=len(candidates),
+        threshold=0,
+        reviewer_mode="fast_only",
+        **kwargs,
+    )
+
+
+def test_async_filter_keeps_input_order(gemini_requests: list[str]) -> None:
+    candidates = [_candidate(str(i)) for i in range(1, 6)]
+    with _client(concurrency=5) as client:
+        out = _filter(client, candidates)
+        # A second call reuses the client's loop and connection pool.
+        loop = client._loop
+        _filter(client, candidates[:1])
+        assert client._loop is loop
+    assert [j.relevance_score for j in out["all_judgements"]] == [1, 2, 3, 4, 5]
+    assert [out["by_id"][c.id].relevance_score for c in candidates] == [1, 2, 3, 4, 5]
+    assert sorted(gemini_requests) == ["1", "1", "2", "3", "4", "5"]
+
+
+def test_async_filter_stops_on_cancel(gemini_requests: list[str]) -> None:
+    cancel = threading.Event()
+
+    def progress(stage: str, message: str, done: int, total: int) -> None:
+        cancel.set()
+
+    with _client(concurrency=1) as client, pytest.raises(CancelledError):
+        _filter(client, [_candidate(str(i)) for i in range(1, 6)], progress_cb=progress, cancel=cancel)
+    assert gemini_requests == ["1"]
+
+
+def test_async_filter_serves_repeats_from_cache(work_dir: Path, gemini_requests: list[str]) -> None:
+    candidates = [_candidate(str(i)) for i in range(1, 4)]
+    arch = ArchivistSQLite(work_dir / "dailyarxiv.sqlite")
+    with arch, _client(concurrency=3, cache=arch, cache_ttl_secs=60) as client:
+        first = _filter(client, candidates)
+        second = _filter(client, candidates)
+    assert len(gemini_requests) == 3
+    assert second["all_judgements"] == first["all_judgements"]
+
+
+def test_batched_filter_falls_back_to_per_paper_judgements() -> None:
+    calls: list[str] = []
+
+    class FakeLLM(LLMClient):
+        def _complete(self, *, model: str, system: str, prompt: str) -> str:
+            if "Papers:" in prompt:
+                ids = re.findall(r"^\[(\d+)\]$", prompt, flags=re.M)
+                calls.append("batch " + ",".join(ids))
+                if ids[0] == "1":
+                    # Short reply: only the first paper of the batch comes back.
+                    return json.dumps([{"id": "1", "is_relevant": True, "relevance_score": 1, "reason_cn": "相关"}])
+                # Truncated reply (and its repair attempt): nothing usable.
+                return '[{"id": "4", "is_relevant": tr'
+            n = re.search(r"Paper title: Paper (\d+)", prompt).group(1)
+            calls.append(n)
+            return json.dumps({"is_relevant": True, "relevance_score": int(n), "reason_cn": "相关"})
+
+    client = FakeLLM(
+        api_key="k", base_url="https://example.invalid/gemini", model_fast="m", model_smart="m", temperature=0.0
+    )
+    candidates = [_candidate(str(i)) for i in range(1, 6)]
+    out = client.filter_relevance_batched(
+        candidates=candidates,
+        keywords=["rag"],
+        max_selected=5,
+        threshold=0,
+        reviewer_mode="fast_only",
+        batch_size=3,
+    )
+    assert [j.relevance_score for j in out["all_judgements"]] == [1, 2, 3, 4, 5]
+    assert calls == ["batch 1,2,3", "batch 4,5", "batch 4,5", "2", "3", "4", "5"]
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_rate_limit_refills_per_minute() -> None:
+    clock = _FakeClock()
+    rpm = _RateLimit(rpm=2, tpm=0, clock=clock)
+    # A full bucket allows a burst of `rpm` requests, then each one waits for its share of the minute.
+    assert rpm.reserve(10) == 0.0
+    assert rpm.reserve(10) == 0.0
+    assert rpm.reserve(10) == pytest.approx(30.0)
+    clock.now += 30.0
+    assert rpm.reserve(10) == pytest.approx(30.0)
+    clock.now += 90.0
+    assert rpm.reserve(10) == 0.0
+
+    tpm = _RateLimit(rpm=0, tpm=600, clock=clock)
+    assert tpm.reserve(500) == 0.0
+    assert tpm.reserve(200) == pytest.approx(10.0)
+    clock.now += 10.0
+    assert tpm.reserve(0) == 0.0
+
+    assert _RateLimit(rpm=0, tpm=0, clock=clock).reserve(10**9) == 0.0
+
+
+def test_chat_waits_when_rate_limit_is_exhausted(monkeypatch: pytest.MonkeyPatch) -> None:
+    sleeps: list[float] = []
+    monkeypatch.setattr(llm_client.time, "sleep", sleeps.append)
+
+    class FakeLLM(LLMClient):
+        def _complete(self, *, model: str, system: str, prompt: str) -> str:
+            return '{"global_trend": "趋势"}'
+
+    client = FakeLLM(
+        api_key="k", base_url="https://example.invalid/gemini", model_fast="m", model_smart="m", temperature=0.0
+    )
+    client._rate = _RateLimit(rpm=1, tpm=0, clock=_FakeClock())
+    a = client._chat_json(model="m", system="s", user="u", schema_hint="{}")
+    b = client._chat_json(model="m", system="s", user="u", schema_hint="{}")
+    assert a == b == {"global_trend": "趋势"}
+    assert sleeps == [pytest.approx(60.0)]